@@ -7,7 +7,7 @@ from starlette.responses import JSONResponse
 from auth.session import SessionManager
 from auth.exceptions import SessionExpiredError
 from api.base import error_response, ErrorCodes
-from utils.user_context import set_current_user_id, clear_current_user_id
+from utils.user_context import set_current_user_id, reset_current_user_id
 
 
 class AuthMiddleware(BaseHTTPMiddleware):
@@ -76,7 +76,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             )
 
         # Set user context for RLS
-        set_current_user_id(session.user_id)
+        token = set_current_user_id(session.user_id)
         request.state.user_id = session.user_id
         request.state.session = session
 
@@ -84,5 +84,5 @@ class AuthMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
         finally:
-            # Always clear context
-            clear_current_user_id()
+            # Always restore the context from before this request
+            reset_current_user_id(token)
@@ -109,18 +109,47 @@ class PostgresClient:
         return convert(params)
 
     def execute(
-        self, query: str, params: tuple | dict | None = None
+        self,
+        query: str,
+        params: tuple | dict | None = None,
+        prepare: bool | None = None
     ) -> list[dict[str, Any]]:
-        """Execute query, return list of row dicts. Empty list if no results."""
+        """
+        Execute query, return list of row dicts. Empty list if no results.
+
+        prepare=True makes psycopg prepare the statement server-side on first
+        use rather than after its default threshold of repeated executions.
+        Worth it only for hot statements.
+        """
         params = self._convert_params(params)
         with self.get_connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
-                cur.execute(query, params)
+                cur.execute(query, params, prepare=prepare)
                 if cur.description:
                     return [dict(row) for row in cur.fetchall()]
                 conn.commit()
                 return []
 
+    def copy_rows(
+        self, table: str, columns: list[str], rows: list[tuple]
+    ) -> None:
+        """
+        Stream rows into table with COPY FROM STDIN in one round trip, then commit.
+
+        Only for tables without row level security: Postgres rejects COPY FROM
+        into RLS-enabled tables for non-owner roles such as the app user.
+        """
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+        )
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                with cur.copy(statement) as copy:
+                    for row in rows:
+                        copy.write_row(self._convert_params(row))
+            conn.commit()
+
     def execute_single(
         self, query: str, params: tuple | dict | None = None
     ) -> dict[str, Any] | None:
@@ -140,13 +169,16 @@ class PostgresClient:
                 return result[0] if result else None
 
     def execute_returning(
-        self, query: str, params: tuple | dict | None = None
+        self,
+        query: str,
+        params: tuple | dict | None = None,
+        prepare: bool | None = None
     ) -> list[dict[str, Any]]:
-        """Execute INSERT/UPDATE with RETURNING, return results."""
+        """Execute INSERT/UPDATE with RETURNING, return results. prepare as in execute()."""
         params = self._convert_params(params)
         with self.get_connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
-                cur.execute(query, params)
+                cur.execute(query, params, prepare=prepare)
                 results = [dict(row) for row in cur.fetchall()]
                 conn.commit()
                 return results
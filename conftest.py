@@ -0,0 +1,15 @@
+"""Root pytest plugin: environment setup for the CRM test suite."""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+def pytest_configure(config):
+    """Register markers and load .env."""
+    config.addinivalue_line(
+        "markers", "slow: multi-step state-transition tests; skip with -m 'not slow'"
+    )
+
+    # override=True ensures .env takes precedence over shell env vars
+    load_dotenv(Path(__file__).parent / ".env", override=True)
@@ -10,15 +10,43 @@ The audit_log table has NO RLS - all audit entries are visible regardless of
 user context. This is intentional for administrative oversight.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from uuid import UUID, uuid4
-from typing import Any
+from typing import Any, Iterator
 
 from clients.postgres_client import PostgresClient
 from utils.user_context import get_current_user_id
 from utils.timezone import now_utc
 
 
+# Rows deferred by an open AuditLogger.batch() in the current context, else None
+_pending_rows: ContextVar[list[tuple] | None] = ContextVar("audit_pending_rows", default=None)
+
+_COLUMNS = ["id", "user_id", "entity_type", "entity_id", "action", "changes", "created_at"]
+
+_INSERT_SQL = """
+    INSERT INTO audit_log (id, user_id, entity_type, entity_id, action, changes, created_at)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+_ENTITY_HISTORY_SQL = """
+    SELECT id, user_id, entity_type, entity_id, action, changes, created_at
+    FROM audit_log
+    WHERE entity_type = %s AND entity_id = %s
+    ORDER BY created_at DESC, seq DESC
+"""
+
+_USER_ACTIVITY_SQL = """
+    SELECT id, user_id, entity_type, entity_id, action, changes, created_at
+    FROM audit_log
+    WHERE user_id = %s
+    ORDER BY created_at DESC, seq DESC
+    LIMIT %s
+"""
+
+
 class AuditAction(Enum):
     """Type of change made to an entity."""
 
@@ -45,19 +73,26 @@ def compute_changes(
         Empty dict if no changes.
     """
     exclude = exclude_fields or {"updated_at"}
-    changes = {}
-
-    all_keys = set(old.keys()) | set(new.keys())
-    for key in all_keys:
-        if key in exclude:
-            continue
-
-        old_val = old.get(key)
-        new_val = new.get(key)
-
-        if old_val != new_val:
-            changes[key] = {"old": old_val, "new": new_val}
-
+    old_keys = old.keys() - exclude
+    new_keys = new.keys() - exclude
+
+    # A key missing on one side reads as None, so None-valued additions and
+    # removals are not changes
+    changes = {
+        key: {"old": old[key], "new": new[key]}
+        for key in old_keys & new_keys
+        if old[key] != new[key]
+    }
+    changes.update(
+        (key, {"old": None, "new": new[key]})
+        for key in new_keys - old_keys
+        if new[key] is not None
+    )
+    changes.update(
+        (key, {"old": old[key], "new": None})
+        for key in old_keys - new_keys
+        if old[key] is not None
+    )
     return changes
 
 
@@ -134,22 +169,55 @@ class AuditLogger:
         if user_id is None:
             user_id = get_current_user_id()
 
-        # audit_log has NO RLS so regular execute() works
-        self.postgres.execute(
-            """
-            INSERT INTO audit_log (id, user_id, entity_type, entity_id, action, changes, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """,
-            (
-                uuid4(),
-                user_id,
-                entity_type,
-                entity_id,
-                action.value,
-                Json(changes),
-                now_utc()
-            )
-        )
+        row = (uuid4(), user_id, entity_type, entity_id, action.value, Json(changes), now_utc())
+
+        pending = _pending_rows.get()
+        if pending is not None:
+            pending.append(row)
+            return
+
+        # audit_log has NO RLS so regular execute() works. Prepared because it
+        # fires on every mutation.
+        self.postgres.execute(_INSERT_SQL, row, prepare=True)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer audit writes made inside the block and flush them in one batch.
+
+        Entries keep the user and timestamp from when they were logged. The
+        flush runs even if the block raises, since the entity writes they
+        describe have already committed; if that flush fails too, its error
+        is raised chained from the block's. Nested batches join the outermost.
+
+        Usage:
+            with audit.batch():
+                for attr in attrs:
+                    audit.log_change(...)
+        """
+        if _pending_rows.get() is not None:
+            yield
+            return
+
+        pending: list[tuple] = []
+        token = _pending_rows.set(pending)
+        try:
+            yield
+        except BaseException as exc:
+            _pending_rows.reset(token)
+            try:
+                self._write_rows(pending)
+            except Exception as flush_error:
+                raise flush_error from exc
+            raise
+
+        _pending_rows.reset(token)
+        self._write_rows(pending)
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        """Stream deferred rows in with one COPY (audit_log has no RLS)."""
+        if rows:
+            self.postgres.copy_rows("audit_log", _COLUMNS, rows)
 
     def get_entity_history(
         self,
@@ -166,14 +234,9 @@ class AuditLogger:
         Returns:
             List of audit entries, newest first.
         """
+        # Prepared: history views re-run the same lookup constantly
         return self.postgres.execute(
-            """
-            SELECT id, user_id, entity_type, entity_id, action, changes, created_at
-            FROM audit_log
-            WHERE entity_type = %s AND entity_id = %s
-            ORDER BY created_at DESC
-            """,
-            (entity_type, entity_id)
+            _ENTITY_HISTORY_SQL, (entity_type, entity_id), prepare=True
         )
 
     def get_user_activity(
@@ -194,13 +257,4 @@ class AuditLogger:
         if user_id is None:
             user_id = get_current_user_id()
 
-        return self.postgres.execute(
-            """
-            SELECT id, user_id, entity_type, entity_id, action, changes, created_at
-            FROM audit_log
-            WHERE user_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
-            """,
-            (user_id, limit)
-        )
+        return self.postgres.execute(_USER_ACTIVITY_SQL, (user_id, limit), prepare=True)
@@ -7,7 +7,7 @@ the primary operation (DB write + audit) has already committed.
 """
 
 import logging
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Tuple
 
 from core.events import CRMEvent
 
@@ -23,7 +23,9 @@ class EventBus:
     """
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # Tuples, replaced on subscribe, so publish always iterates a stable
+        # snapshot even if a handler subscribes mid-dispatch
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
 
     def subscribe(self, event_type: str, callback: Callable):
         """
@@ -33,9 +35,11 @@ class EventBus:
             event_type: Name of event class to subscribe to (e.g. 'TicketCompleted')
             callback: Function to call when event is published
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
+
+    def clear(self):
+        """Remove every subscription, leaving the bus as if newly created."""
+        self._subscribers.clear()
 
     def publish(self, event: CRMEvent):
         """
@@ -50,10 +54,7 @@ class EventBus:
         """
         event_type = event.__class__.__name__
 
-        if event_type not in self._subscribers:
-            return
-
-        for callback in self._subscribers[event_type]:
+        for callback in self._subscribers.get(event_type, ()):
             try:
                 callback(event)
             except Exception:
@@ -23,7 +23,7 @@ from uuid import uuid4
 from utils.timezone import now_utc
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CRMEvent:
     """Base class for all CRM domain events."""
     event_id: str = field(default_factory=lambda: str(uuid4()))
@@ -35,13 +35,13 @@ class CRMEvent:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketEvent(CRMEvent):
     """Events related to ticket lifecycle."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketCreated(TicketEvent):
     """A new ticket was created in SCHEDULED status."""
     ticket: Any = None  # Ticket — using Any to avoid circular import
@@ -51,7 +51,7 @@ class TicketCreated(TicketEvent):
         return cls(ticket=ticket)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketClockIn(TicketEvent):
     """Technician clocked in to a ticket."""
     ticket: Any = None
@@ -61,7 +61,7 @@ class TicketClockIn(TicketEvent):
         return cls(ticket=ticket)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketCompleted(TicketEvent):
     """Ticket was closed/completed."""
     ticket: Any = None
@@ -71,7 +71,7 @@ class TicketCompleted(TicketEvent):
         return cls(ticket=ticket)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketCancelled(TicketEvent):
     """Ticket was cancelled."""
     ticket: Any = None
@@ -86,13 +86,13 @@ class TicketCancelled(TicketEvent):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvoiceEvent(CRMEvent):
     """Events related to invoice lifecycle."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvoiceSent(InvoiceEvent):
     """Invoice was sent to customer."""
     invoice: Any = None
@@ -102,7 +102,7 @@ class InvoiceSent(InvoiceEvent):
         return cls(invoice=invoice)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvoicePaid(InvoiceEvent):
     """Invoice was fully paid."""
     invoice: Any = None
@@ -117,13 +117,13 @@ class InvoicePaid(InvoiceEvent):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CustomerEvent(CRMEvent):
     """Events related to customer lifecycle."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CustomerCreated(CustomerEvent):
     """A new customer was created."""
     customer: Any = None
@@ -138,13 +138,13 @@ class CustomerCreated(CustomerEvent):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoteEvent(CRMEvent):
     """Events related to note lifecycle."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoteCreated(NoteEvent):
     """A new note was created."""
     note: Any = None
@@ -7,16 +7,24 @@ notes entered during ticket close-out.
 
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any
 
-from json_repair import repair_json
+from json_repair import loads as repair_loads
 
 from clients.llm_client import LLMClient
 from core.models.attribute import ExtractedAttributes
 
 logger = logging.getLogger(__name__)
 
+# Outermost {...} in an LLM response, skipping any preamble or code fences.
+# An unclosed object (truncated output) runs to the end for repair to close.
+_JSON_OBJECT_RE = re.compile(r"\{.*\}|\{.*", re.DOTALL)
+
 
 class AttributeExtractor:
     """
@@ -48,8 +56,33 @@ Example of correct output:
 {"customer_demographic": "elderly", "pet": {"type": "dog", "name": "Biscuit"}, "property_notes": "keep gate closed", "equipment_needed": "extension ladder", "property_details": "complex 2nd story sill"}
 """
 
-    def __init__(self, llm: LLMClient):
+    # Part of every cache key: bump whenever SYSTEM_PROMPT or BATCH_INSTRUCTIONS
+    # changes so extractions made with the old prompt are not reused
+    PROMPT_VERSION = "1"
+
+    # Upper bound on simultaneous single-note LLM calls
+    MAX_CONCURRENT_CALLS = 4
+
+    # Notes per batched LLM call, and that call's output token ceiling. The
+    # ceiling keeps a full batch response inside ExtractedAttributes.raw_response.
+    BATCH_SIZE = 8
+    MAX_BATCH_TOKENS = 2048
+
+    BATCH_INSTRUCTIONS = """
+
+You will be given several notes as a JSON array of {"id": ..., "notes": ...} objects.
+Extract attributes from each note independently, following the rules above.
+Output one JSON object mapping each note's id (as a string) to its attributes object, e.g.:
+{"0": {"pet": "cat"}, "1": {}}
+"""
+
+    def __init__(self, llm: LLMClient, cache_size: int = 256):
         self.llm = llm
+        # Recent extractions by _cache_key, least recently used first.
+        # Technicians reuse boilerplate notes across tickets.
+        self._cache: OrderedDict[str, ExtractedAttributes] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
 
     def extract_attributes(self, notes: str) -> ExtractedAttributes:
         """
@@ -64,6 +97,10 @@ Example of correct output:
         Returns:
             ExtractedAttributes with parsed attributes and confidence
         """
+        cached = self._cached(notes)
+        if cached is not None:
+            return cached
+
         response = self.llm.generate(
             messages=[
                 {"role": "system", "content": self.SYSTEM_PROMPT},
@@ -74,11 +111,102 @@ Example of correct output:
         raw_content = response.content
         attributes = self._parse_json_with_repair(raw_content)
 
-        return ExtractedAttributes(
+        result = ExtractedAttributes(
             attributes=attributes,
             raw_response=raw_content,
             confidence=Decimal("0.80")  # Default confidence for LLM extraction
         )
+        self._remember(notes, result)
+        return result
+
+    def extract_attributes_batch(self, notes: list[str]) -> list[ExtractedAttributes]:
+        """
+        Extract attributes from several notes, BATCH_SIZE notes per LLM call.
+
+        Cached notes are not resent. Notes a batch response has no attributes
+        object for (unparseable or missing ids) are retried individually via
+        extract_attributes, up to MAX_CONCURRENT_CALLS at a time. Errors from
+        the LLM call itself propagate.
+
+        Args:
+            notes: Free-form technician notes
+
+        Returns:
+            One ExtractedAttributes per note, in input order
+        """
+        results: list[ExtractedAttributes | None] = [self._cached(n, batched=True) for n in notes]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            chunk = pending[start:start + self.BATCH_SIZE]
+            # A lone note goes through the single-note path below
+            if len(chunk) > 1:
+                self._extract_chunk(notes, chunk, results)
+
+        # Retry what the batches missed one note per call, concurrently
+        missed = [i for i, result in enumerate(results) if result is None]
+        if missed:
+            with ThreadPoolExecutor(max_workers=min(len(missed), self.MAX_CONCURRENT_CALLS)) as executor:
+                for i, result in zip(missed, executor.map(self.extract_attributes, [notes[i] for i in missed])):
+                    results[i] = result
+
+        return results
+
+    def _extract_chunk(
+        self,
+        notes: list[str],
+        chunk: list[int],
+        results: list[ExtractedAttributes | None]
+    ) -> None:
+        """Fill results for the notes at indexes chunk with one LLM call."""
+        response = self.llm.generate(
+            messages=[
+                {"role": "system", "content": self.SYSTEM_PROMPT + self.BATCH_INSTRUCTIONS},
+                {"role": "user", "content": "Extract attributes from each of these notes:\n\n" + json.dumps(
+                    [{"id": i, "notes": notes[i]} for i in chunk]
+                )}
+            ],
+            max_tokens=min(1024 * len(chunk), self.MAX_BATCH_TOKENS)
+        )
+
+        by_id = self._parse_json_with_repair(response.content)
+        if not isinstance(by_id, dict):
+            by_id = {}
+
+        for i in chunk:
+            attributes = by_id.get(str(i))
+            if not isinstance(attributes, dict):
+                continue
+            # Every note in the chunk keeps the whole batch response
+            results[i] = ExtractedAttributes(
+                attributes=attributes,
+                raw_response=response.content,
+                confidence=Decimal("0.80")
+            )
+            self._remember(notes[i], results[i], batched=True)
+
+    def _cache_key(self, notes: str, batched: bool) -> str:
+        """Key an extraction by prompt version, which prompt produced it, and note text."""
+        return f"{self.PROMPT_VERSION}|{'batch' if batched else 'single'}|{notes}"
+
+    def _cached(self, notes: str, batched: bool = False) -> ExtractedAttributes | None:
+        """Cached extraction for these notes under that prompt, marking it recently used."""
+        key = self._cache_key(notes, batched)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _remember(self, notes: str, result: ExtractedAttributes, batched: bool = False) -> None:
+        """Cache a non-empty extraction, evicting the least recently used."""
+        # Empty results are not cached so a retry gets a fresh LLM attempt
+        if not result.attributes:
+            return
+        with self._cache_lock:
+            self._cache[self._cache_key(notes, batched)] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
     def _parse_json_with_repair(self, content: str) -> dict[str, Any]:
         """
@@ -99,10 +227,15 @@ Example of correct output:
         except json.JSONDecodeError:
             pass
 
-        # Try to repair the JSON
+        # No object at all (e.g. a refusal) - nothing for repair to salvage
+        match = _JSON_OBJECT_RE.search(content)
+        if match is None:
+            logger.warning("No JSON object in LLM response")
+            return {}
+
+        # Repair and parse in one pass
         try:
-            repaired = repair_json(content)
-            result = json.loads(repaired)
+            result = repair_loads(match.group(0))
             if isinstance(result, dict):
                 return result
             # If repair returned a list or primitive, wrap or ignore
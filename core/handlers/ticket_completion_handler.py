@@ -2,7 +2,8 @@
 Handler for TicketCompleted events.
 
 On ticket completion, extracts structured attributes from unprocessed
-notes via LLM, persists them, and marks notes as processed.
+notes via LLM in batches of the extractor's BATCH_SIZE, persisting each
+batch and marking its notes processed before sending the next.
 """
 
 import logging
@@ -32,16 +33,20 @@ def handle_ticket_completed(extractor, attribute_service, note_service) -> Calla
         ticket = event.ticket
         notes = note_service.list_unprocessed_for_ticket(ticket.id)
 
-        for note in notes:
-            extraction = extractor.extract_attributes(note.content)
-
-            attribute_service.bulk_create_from_extraction(
-                ticket.customer_id,
-                extraction.attributes,
-                note.id,
-                extraction.confidence,
-            )
-
-            note_service.mark_processed(note.id)
+        # Extract and persist one batch at a time, so a failure keeps the
+        # notes already marked processed and a retry only resends the rest
+        for start in range(0, len(notes), extractor.BATCH_SIZE):
+            chunk = notes[start:start + extractor.BATCH_SIZE]
+            extractions = extractor.extract_attributes_batch([note.content for note in chunk])
+
+            for note, extraction in zip(chunk, extractions):
+                attribute_service.bulk_create_from_extraction(
+                    ticket.customer_id,
+                    extraction.attributes,
+                    note.id,
+                    extraction.confidence,
+                )
+
+                note_service.mark_processed(note.id)
 
     return handler
@@ -41,5 +41,5 @@ class ExtractedAttributes(BaseModel):
     """Attributes extracted from notes by LLM."""
 
     attributes: dict[str, Any]
-    raw_response: str = Field(..., max_length=10000)
+    raw_response: str = Field(..., max_length=10000)  # Batched notes share their batch's response
     confidence: Decimal = Field(..., ge=0, le=1, decimal_places=2)
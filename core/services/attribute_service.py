@@ -113,6 +113,89 @@ class AttributeService:
 
         return attr
 
+    def _upsert(self, customer_id: UUID, items: list[AttributeCreate]) -> list[Attribute]:
+        """
+        Insert or update attributes for one customer with one multi-row statement.
+
+        Args:
+            customer_id: Customer UUID all items belong to
+            items: Attribute data, at most one per key
+
+        Returns:
+            Attributes in the same order as items
+
+        Raises:
+            ValueError: If two items share a key
+        """
+        keys = [item.key for item in items]
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Duplicate attribute keys in one upsert: {keys}")
+
+        user_id = get_current_user_id()
+        now = now_utc()
+
+        # Current values decide CREATE vs UPDATE audit entries and old_value
+        previous = {
+            row["key"]: row["value"]
+            for row in self.postgres.execute(
+                "SELECT key, value FROM attributes WHERE customer_id = %s AND key = ANY(%s)",
+                (customer_id, keys)
+            )
+        }
+
+        params = []
+        for item in items:
+            params.extend([
+                uuid4(), user_id, customer_id, item.key, json.dumps(item.value),
+                item.source_type, item.source_note_id, item.confidence,
+                now, now
+            ])
+
+        rows = self.postgres.execute_returning(
+            f"""
+            INSERT INTO attributes (
+                id, user_id, customer_id, key, value,
+                source_type, source_note_id, confidence,
+                created_at, updated_at
+            ) VALUES {', '.join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(items))}
+            ON CONFLICT (customer_id, key) DO UPDATE
+            SET value = EXCLUDED.value, source_type = EXCLUDED.source_type,
+                source_note_id = EXCLUDED.source_note_id,
+                confidence = EXCLUDED.confidence, updated_at = EXCLUDED.updated_at
+            RETURNING *
+            """,
+            tuple(params)
+        )
+        by_key = {row["key"]: Attribute.model_validate(row) for row in rows}
+
+        result = []
+        with self.audit.batch():
+            for item in items:
+                attr = by_key[item.key]
+
+                if item.key in previous:
+                    self.audit.log_change(
+                        entity_type="attribute",
+                        entity_id=attr.id,
+                        action=AuditAction.UPDATE,
+                        changes={
+                            "key": item.key,
+                            "old_value": previous[item.key],
+                            "new_value": item.value
+                        }
+                    )
+                else:
+                    self.audit.log_change(
+                        entity_type="attribute",
+                        entity_id=attr.id,
+                        action=AuditAction.CREATE,
+                        changes={"created": item.model_dump(mode="json", exclude_none=True)}
+                    )
+
+                result.append(attr)
+
+        return result
+
     def get_by_id(self, attribute_id: UUID) -> Attribute | None:
         """
         Get attribute by ID.
@@ -222,17 +305,17 @@ class AttributeService:
         Returns:
             List of created attributes
         """
-        created = []
+        if not attributes:
+            return []
 
-        for key, value in attributes.items():
-            attr = self.create(AttributeCreate(
+        return self._upsert(customer_id, [
+            AttributeCreate(
                 customer_id=customer_id,
                 key=key,
                 value=value,
                 source_type="llm_extracted",
                 source_note_id=source_note_id,
                 confidence=confidence
-            ))
-            created.append(attr)
-
-        return created
+            )
+            for key, value in attributes.items()
+        ])
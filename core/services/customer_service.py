@@ -225,13 +225,14 @@ class CustomerService:
             offset: Offset for pagination
 
         Returns:
-            List of customers, ordered by created_at DESC
+            List of customers, ordered by created_at DESC (id breaks ties so
+            pages stay stable for rows created in the same transaction)
         """
         rows = self.postgres.execute(
             """
             SELECT * FROM customers
             WHERE deleted_at IS NULL
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, id
             LIMIT %s OFFSET %s
             """,
             (limit, offset)
@@ -84,27 +84,23 @@ class InvoiceService:
         """
         user_id = get_current_user_id()
 
-        # Get ticket and customer
+        # Get ticket's customer and line item subtotal in one round trip
         ticket = self.postgres.execute_single(
-            "SELECT customer_id FROM tickets WHERE id = %s",
+            """
+            SELECT t.customer_id,
+                   (SELECT COALESCE(SUM(li.total_price_cents), 0)
+                    FROM line_items li
+                    WHERE li.ticket_id = t.id AND li.deleted_at IS NULL) as subtotal
+            FROM tickets t
+            WHERE t.id = %s
+            """,
             (ticket_id,)
         )
         if ticket is None:
             raise ValueError(f"Ticket {ticket_id} not found")
 
         customer_id = ticket["customer_id"]
-
-        # Sum line items
-        result = self.postgres.execute_single(
-            """
-            SELECT COALESCE(SUM(total_price_cents), 0) as subtotal
-            FROM line_items
-            WHERE ticket_id = %s AND deleted_at IS NULL
-            """,
-            (ticket_id,)
-        )
-
-        subtotal_cents = result["subtotal"]
+        subtotal_cents = ticket["subtotal"]
         if subtotal_cents == 0:
             raise ValueError(f"Ticket {ticket_id} has no line items")
 
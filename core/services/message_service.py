@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 class MessageService:
     """Service for scheduled message operations."""
 
+    # Messages per process_pending chunk; each chunk's outcomes are written
+    # before the next chunk is sent
+    STATUS_FLUSH_SIZE = 25
+
     def __init__(self, postgres: PostgresClient, audit: AuditLogger):
         self.postgres = postgres
         self.audit = audit
@@ -56,7 +60,8 @@ class MessageService:
                 message_id, user_id, data.customer_id, data.ticket_id,
                 data.message_type.value, data.template_name, data.subject, data.body,
                 data.scheduled_for, MessageStatus.PENDING.value, now
-            )
+            ),
+            prepare=True  # Hot path: reminders are scheduled for every ticket
         )[0]
 
         message = ScheduledMessage.model_validate(row)
@@ -92,7 +97,7 @@ class MessageService:
 
     def mark_sent(self, message_id: UUID) -> ScheduledMessage:
         """
-        Mark a message as sent.
+        Mark a pending message as sent.
 
         Args:
             message_id: Message UUID
@@ -101,36 +106,13 @@ class MessageService:
             Updated message with SENT status
 
         Raises:
-            ValueError: If message not found
+            ValueError: If message not found or not pending
         """
-        current = self.get_by_id(message_id)
-        if current is None:
-            raise ValueError(f"Message {message_id} not found")
-
-        row = self.postgres.execute_returning(
-            """
-            UPDATE scheduled_messages
-            SET status = %s
-            WHERE id = %s
-            RETURNING *
-            """,
-            (MessageStatus.SENT.value, message_id)
-        )[0]
-
-        updated = ScheduledMessage.model_validate(row)
-
-        self.audit.log_change(
-            entity_type="scheduled_message",
-            entity_id=message_id,
-            action=AuditAction.UPDATE,
-            changes={"status": {"old": current.status.value, "new": MessageStatus.SENT.value}}
-        )
-
-        return updated
+        return self._transition_one(message_id, MessageStatus.SENT)
 
     def mark_failed(self, message_id: UUID) -> ScheduledMessage:
         """
-        Mark a message as failed (gateway error).
+        Mark a pending message as failed (gateway error).
 
         Args:
             message_id: Message UUID
@@ -139,36 +121,13 @@ class MessageService:
             Updated message with FAILED status
 
         Raises:
-            ValueError: If message not found
+            ValueError: If message not found or not pending
         """
-        current = self.get_by_id(message_id)
-        if current is None:
-            raise ValueError(f"Message {message_id} not found")
-
-        row = self.postgres.execute_returning(
-            """
-            UPDATE scheduled_messages
-            SET status = %s
-            WHERE id = %s
-            RETURNING *
-            """,
-            (MessageStatus.FAILED.value, message_id)
-        )[0]
-
-        updated = ScheduledMessage.model_validate(row)
-
-        self.audit.log_change(
-            entity_type="scheduled_message",
-            entity_id=message_id,
-            action=AuditAction.UPDATE,
-            changes={"status": {"old": current.status.value, "new": MessageStatus.FAILED.value}}
-        )
-
-        return updated
+        return self._transition_one(message_id, MessageStatus.FAILED)
 
     def mark_skipped(self, message_id: UUID, reason: str) -> ScheduledMessage:
         """
-        Mark a message as skipped (precondition failed - no email, etc.).
+        Mark a pending message as skipped (precondition failed - no email, etc.).
 
         Args:
             message_id: Message UUID
@@ -178,35 +137,9 @@ class MessageService:
             Updated message with SKIPPED status
 
         Raises:
-            ValueError: If message not found
+            ValueError: If message not found or not pending
         """
-        current = self.get_by_id(message_id)
-        if current is None:
-            raise ValueError(f"Message {message_id} not found")
-
-        row = self.postgres.execute_returning(
-            """
-            UPDATE scheduled_messages
-            SET status = %s
-            WHERE id = %s
-            RETURNING *
-            """,
-            (MessageStatus.SKIPPED.value, message_id)
-        )[0]
-
-        updated = ScheduledMessage.model_validate(row)
-
-        self.audit.log_change(
-            entity_type="scheduled_message",
-            entity_id=message_id,
-            action=AuditAction.UPDATE,
-            changes={
-                "status": {"old": current.status.value, "new": MessageStatus.SKIPPED.value},
-                "skip_reason": reason
-            }
-        )
-
-        return updated
+        return self._transition_one(message_id, MessageStatus.SKIPPED, skip_reason=reason)
 
     def cancel(self, message_id: UUID) -> ScheduledMessage:
         """
@@ -221,33 +154,7 @@ class MessageService:
         Raises:
             ValueError: If message not found or not pending
         """
-        current = self.get_by_id(message_id)
-        if current is None:
-            raise ValueError(f"Message {message_id} not found")
-
-        if current.status != MessageStatus.PENDING:
-            raise ValueError(f"Message {message_id} is not pending")
-
-        row = self.postgres.execute_returning(
-            """
-            UPDATE scheduled_messages
-            SET status = %s
-            WHERE id = %s
-            RETURNING *
-            """,
-            (MessageStatus.CANCELLED.value, message_id)
-        )[0]
-
-        updated = ScheduledMessage.model_validate(row)
-
-        self.audit.log_change(
-            entity_type="scheduled_message",
-            entity_id=message_id,
-            action=AuditAction.UPDATE,
-            changes={"status": {"old": current.status.value, "new": MessageStatus.CANCELLED.value}}
-        )
-
-        return updated
+        return self._transition_one(message_id, MessageStatus.CANCELLED)
 
     def list_pending_for_ticket(self, ticket_id: UUID) -> list[ScheduledMessage]:
         """
@@ -292,67 +199,227 @@ class MessageService:
 
         return [ScheduledMessage.model_validate(row) for row in rows]
 
-    def list_for_customer(self, customer_id: UUID, limit: int = 50) -> list[ScheduledMessage]:
+    def list_for_customer(
+        self,
+        customer_id: UUID,
+        limit: int = 50,
+        body_contains: str | None = None
+    ) -> list[ScheduledMessage]:
         """
         List all messages for a customer.
 
         Args:
             customer_id: Customer UUID
             limit: Maximum results
+            body_contains: Only include messages whose body contains this text
 
         Returns:
             List of messages ordered by scheduled_for DESC
         """
+        where, params = _customer_filter(customer_id, body_contains=body_contains)
+        params.append(limit)
+
         rows = self.postgres.execute(
-            """
+            f"""
             SELECT * FROM scheduled_messages
-            WHERE customer_id = %s
+            WHERE {where}
             ORDER BY scheduled_for DESC
             LIMIT %s
             """,
-            (customer_id, limit)
+            tuple(params)
         )
 
         return [ScheduledMessage.model_validate(row) for row in rows]
 
+    def count_for_customer(
+        self,
+        customer_id: UUID,
+        status: MessageStatus | None = None,
+        body_contains: str | None = None
+    ) -> int:
+        """
+        Count messages for a customer.
+
+        Args:
+            customer_id: Customer UUID
+            status: Only count messages in this status
+            body_contains: Only count messages whose body contains this text
+
+        Returns:
+            Number of matching messages
+        """
+        where, params = _customer_filter(customer_id, status, body_contains)
+
+        return self.postgres.execute_scalar(
+            f"SELECT COUNT(*) FROM scheduled_messages WHERE {where}",
+            tuple(params)
+        )
+
     def process_pending(
         self,
         email_client,
-        customer_email_lookup: Callable[[UUID], str | None]
+        customer_email_lookup: Callable[[UUID], str | None] | None = None
     ) -> dict[str, int]:
         """
         Process all pending due messages, attempting to send each.
 
         Args:
             email_client: Email client with send(to, subject, body) method
-            customer_email_lookup: Function to get email for customer_id
+            customer_email_lookup: Function to get email for customer_id.
+                Defaults to the customers' stored emails, fetched for the
+                whole batch in one query.
 
         Returns:
             Dict with counts: {"sent": N, "failed": N, "skipped": N}
         """
         pending = self.list_pending_due()
+        if customer_email_lookup is None:
+            customer_email_lookup = self._customer_emails(
+                {message.customer_id for message in pending}
+            ).get
         results = {"sent": 0, "failed": 0, "skipped": 0}
 
-        for message in pending:
-            # Check preconditions
-            email = customer_email_lookup(message.customer_id)
-            if email is None:
-                self.mark_skipped(message.id, "Customer has no email")
-                results["skipped"] += 1
-                continue
+        for start in range(0, len(pending), self.STATUS_FLUSH_SIZE):
+            outcomes: dict[MessageStatus, list[UUID]] = {
+                MessageStatus.SENT: [],
+                MessageStatus.FAILED: [],
+                MessageStatus.SKIPPED: [],
+            }
 
-            # Attempt to send
             try:
-                email_client.send(
-                    to=email,
-                    subject=message.subject or "",
-                    body=message.body or ""
-                )
-                self.mark_sent(message.id)
-                results["sent"] += 1
-            except Exception as e:
-                logger.error(f"Failed to send message {message.id}: {e}")
-                self.mark_failed(message.id)
-                results["failed"] += 1
+                for message in pending[start:start + self.STATUS_FLUSH_SIZE]:
+                    # Check preconditions
+                    email = customer_email_lookup(message.customer_id)
+                    if email is None:
+                        outcomes[MessageStatus.SKIPPED].append(message.id)
+                        continue
+
+                    # Attempt to send
+                    try:
+                        email_client.send(
+                            to=email,
+                            subject=message.subject or "",
+                            body=message.body or ""
+                        )
+                        outcomes[MessageStatus.SENT].append(message.id)
+                    except Exception as e:
+                        logger.error(f"Failed to send message {message.id}: {e}")
+                        outcomes[MessageStatus.FAILED].append(message.id)
+            finally:
+                # At most one UPDATE per status per chunk. Runs even if a lookup
+                # raises, and a hard crash leaves at most one chunk of already
+                # sent messages pending to be resent.
+                for status, message_ids in outcomes.items():
+                    moved = self._transition_from_pending(
+                        message_ids, status,
+                        skip_reason="Customer has no email" if status == MessageStatus.SKIPPED else None
+                    )
+                    results[status.value] += len(moved)
+
+                    # Cancelled mid-run: the row keeps its new status, and the
+                    # outcome is reported here rather than counted
+                    missed = set(message_ids) - {message.id for message in moved}
+                    for message_id in missed:
+                        logger.warning(
+                            f"Message {message_id} was {status.value} but is no longer "
+                            f"pending; status left unchanged"
+                        )
 
         return results
+
+    def _transition_one(
+        self,
+        message_id: UUID,
+        status: MessageStatus,
+        skip_reason: str | None = None
+    ) -> ScheduledMessage:
+        """Move one pending message to status, raising ValueError if it can't be."""
+        moved = self._transition_from_pending([message_id], status, skip_reason)
+        if moved:
+            return moved[0]
+
+        if self.get_by_id(message_id) is None:
+            raise ValueError(f"Message {message_id} not found")
+        raise ValueError(f"Message {message_id} is not pending")
+
+    def _transition_from_pending(
+        self,
+        message_ids: list[UUID],
+        status: MessageStatus,
+        skip_reason: str | None = None
+    ) -> list[ScheduledMessage]:
+        """
+        Move the still-pending messages among message_ids to status and audit each.
+
+        One guarded UPDATE, so a message that left pending concurrently (e.g.
+        cancelled mid-run) is untouched and absent from the result.
+        """
+        if not message_ids:
+            return []
+
+        rows = self.postgres.execute_returning(
+            """
+            UPDATE scheduled_messages
+            SET status = %s
+            WHERE id = ANY(%s) AND status = %s
+            RETURNING *
+            """,
+            (status.value, message_ids, MessageStatus.PENDING.value)
+        )
+
+        changes = {"status": {"old": MessageStatus.PENDING.value, "new": status.value}}
+        if skip_reason is not None:
+            changes["skip_reason"] = skip_reason
+
+        with self.audit.batch():
+            for row in rows:
+                self.audit.log_change(
+                    entity_type="scheduled_message",
+                    entity_id=row["id"],
+                    action=AuditAction.UPDATE,
+                    changes=changes
+                )
+
+        return [ScheduledMessage.model_validate(row) for row in rows]
+
+    def _customer_emails(self, customer_ids: set[UUID]) -> dict[UUID, str]:
+        """Map customer_id -> email for the given customers that have one."""
+        if not customer_ids:
+            return {}
+
+        rows = self.postgres.execute(
+            """
+            SELECT id, email FROM customers
+            WHERE id = ANY(%s) AND email IS NOT NULL AND deleted_at IS NULL
+            """,
+            (list(customer_ids),)
+        )
+
+        return {row["id"]: row["email"] for row in rows}
+
+
+def _customer_filter(
+    customer_id: UUID,
+    status: MessageStatus | None = None,
+    body_contains: str | None = None
+) -> tuple[str, list]:
+    """Build the WHERE clause and params for per-customer message queries."""
+    conditions = ["customer_id = %s"]
+    params: list = [customer_id]
+
+    if status is not None:
+        conditions.append("status = %s")
+        params.append(status.value)
+
+    if body_contains is not None:
+        # Match literally - escape LIKE wildcards in the search text
+        escaped = (
+            body_contains
+            .replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        conditions.append("body LIKE %s")
+        params.append(f"%{escaped}%")
+
+    return " AND ".join(conditions), params
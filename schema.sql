@@ -194,6 +194,7 @@ CREATE TRIGGER customers_updated_at BEFORE UPDATE ON customers
 CREATE INDEX idx_customers_user ON customers(user_id);
 CREATE INDEX idx_customers_referred_by ON customers(referred_by) WHERE referred_by IS NOT NULL;
 CREATE INDEX idx_customers_reference_id ON customers(user_id, reference_id) WHERE reference_id IS NOT NULL;
+CREATE INDEX idx_customers_live ON customers(user_id, created_at DESC, id) WHERE deleted_at IS NULL;
 
 -- Fuzzy search indexes (pg_trgm)
 CREATE INDEX idx_customers_first_name_trgm ON customers USING GIN (first_name gin_trgm_ops);
@@ -292,7 +293,7 @@ CREATE TRIGGER services_updated_at BEFORE UPDATE ON services
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 CREATE INDEX idx_services_user ON services(user_id);
-CREATE INDEX idx_services_active ON services(user_id) WHERE is_active = true AND deleted_at IS NULL;
+CREATE INDEX idx_services_active ON services(name) WHERE is_active = true AND deleted_at IS NULL;
 
 -- NO RLS: Services are a shared catalog, not user-scoped data.
 -- Soft-delete filtering handled in application layer queries.
@@ -483,6 +484,7 @@ CREATE INDEX idx_invoices_user ON invoices(user_id);
 CREATE INDEX idx_invoices_customer ON invoices(customer_id);
 CREATE INDEX idx_invoices_ticket ON invoices(ticket_id);
 CREATE INDEX idx_invoices_status ON invoices(user_id, status);
+CREATE INDEX idx_invoices_customer_live ON invoices(customer_id, created_at DESC) WHERE deleted_at IS NULL;
 
 -- RLS
 ALTER TABLE invoices ENABLE ROW LEVEL SECURITY;
@@ -883,12 +885,15 @@ CREATE TABLE audit_log (
     action TEXT NOT NULL,  -- 'create', 'update', 'delete'
     changes JSONB NOT NULL,
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    seq BIGINT GENERATED ALWAYS AS IDENTITY,  -- insertion order; breaks created_at ties
     CONSTRAINT audit_valid_action CHECK (action IN ('create', 'update', 'delete'))
 );
 
-CREATE INDEX idx_audit_log_entity ON audit_log(entity_type, entity_id);
-CREATE INDEX idx_audit_log_user ON audit_log(user_id);
-CREATE INDEX idx_audit_log_created ON audit_log(created_at);
+-- Match get_entity_history / get_user_activity: filter, then newest first
+CREATE INDEX idx_audit_log_entity ON audit_log(entity_type, entity_id, created_at DESC, seq DESC);
+CREATE INDEX idx_audit_log_user ON audit_log(user_id, created_at DESC, seq DESC);
+-- Rows arrive in created_at order, so BRIN covers time ranges at a fraction of a B-tree's size
+CREATE INDEX idx_audit_log_created ON audit_log USING BRIN (created_at) WITH (pages_per_range = 32);
 
 
 -- =============================================================================
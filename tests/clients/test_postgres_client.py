@@ -3,6 +3,8 @@
 import pytest
 from uuid import UUID, uuid4
 
+from psycopg.types.json import Json
+
 from clients.postgres_client import PostgresClient
 from utils.user_context import user_context
 
@@ -49,6 +51,18 @@ class TestExecuteMethods:
         results = db.execute("SELECT 1 WHERE false")
         assert results == []
 
+    def test_execute_prepared_returns_same_rows(self, db):
+        """prepare=True only changes how the statement is sent, not results."""
+        for _ in range(2):
+            results = db.execute("SELECT %s::int as num", (7,), prepare=True)
+            assert results == [{"num": 7}]
+
+    def test_execute_returning_prepared_returns_same_rows(self, db):
+        """prepare=True is passed through by execute_returning() too."""
+        for _ in range(2):
+            results = db.execute_returning("SELECT %s::int as num", (7,), prepare=True)
+            assert results == [{"num": 7}]
+
     def test_execute_single_returns_dict(self, db):
         """execute_single() returns first row as dict."""
         result = db.execute_single("SELECT 42 as answer")
@@ -69,6 +83,19 @@ class TestExecuteMethods:
         result = db.execute_scalar("SELECT 1 WHERE false")
         assert result is None
 
+    def test_copy_rows_streams_all_rows(self, db):
+        """copy_rows() loads every row through COPY and commits (audit_log: no RLS)."""
+        entity_ids = [uuid4(), uuid4()]
+        db.copy_rows(
+            "audit_log",
+            ["user_id", "entity_type", "entity_id", "action", "changes"],
+            [(TEST_USER_ID, "copy_test", entity_id, "create", Json({})) for entity_id in entity_ids]
+        )
+        count = db.execute_scalar(
+            "SELECT COUNT(*) FROM audit_log WHERE entity_type = 'copy_test'"
+        )
+        assert count == 2
+
 
 class TestUserIsolation:
     """RLS user isolation - the core security feature."""
@@ -1,21 +1,12 @@
 """Shared test fixtures for CRM test suite."""
 
+import os
+
 import pytest
+from datetime import datetime, timezone
 from uuid import UUID
-from pathlib import Path
-
-from dotenv import load_dotenv
-
-# Load .env file BEFORE any other imports that might use env vars
-# override=True ensures .env takes precedence over shell env vars
-load_dotenv(Path(__file__).parent.parent / ".env", override=True)
-
-# Reset vault client singleton to pick up env vars
-import clients.vault_client as vault_module
-vault_module._vault_client_instance = None
-vault_module._secret_cache.clear()
 
-from utils.user_context import user_context, clear_current_user_id
+from utils.user_context import user_context, set_current_user_id, reset_current_user_id
 
 
 # =============================================================================
@@ -30,6 +21,9 @@ TEST_USER_EMAIL = "testuser@test.local"
 TEST_USER_B_ID = UUID("00000000-0000-0000-0000-000000000002")
 TEST_USER_B_EMAIL = "testuser-b@test.local"
 
+# Fixed far-future time for rows that just need "scheduled later", not "now"
+FUTURE_DT = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
 
 # =============================================================================
 # USER CONTEXT FIXTURES
@@ -38,10 +32,10 @@ TEST_USER_B_EMAIL = "testuser-b@test.local"
 
 @pytest.fixture(autouse=True)
 def reset_user_context():
-    """Ensure clean user context before and after each test."""
-    clear_current_user_id()
+    """Start each test with no user context and restore the prior one after."""
+    token = set_current_user_id(None)
     yield
-    clear_current_user_id()
+    reset_current_user_id(token)
 
 
 @pytest.fixture
@@ -68,62 +62,122 @@ def authenticated_context(test_user_id):
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def event_bus():
-    """Fresh EventBus for each test — no cross-test handler leakage."""
+    """Session-wide EventBus; reset_event_bus empties it after every test."""
     from core.event_bus import EventBus
     return EventBus()
 
 
+@pytest.fixture(autouse=True)
+def reset_event_bus(event_bus):
+    """Drop whatever a test subscribed so handlers never leak into the next one."""
+    yield
+    event_bus.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def reset_vault_state():
+    """Start the session with no cached Vault client or secrets so .env values apply."""
+    import clients.vault_client as vault_module
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(vault_module, "_vault_client_instance", None)
+        mp.setattr(vault_module, "_secret_cache", {})
+        yield
+
+
 @pytest.fixture(scope="session")
-def db():
+def database_urls():
+    """(app_url, admin_url) for this test process.
+
+    Under pytest-xdist each worker gets its own copy of the test database,
+    cloned from it with CREATE DATABASE ... TEMPLATE, so workers never
+    share rows. The clone is dropped when the session ends. Without xdist
+    the Vault URLs are used as-is.
+    """
+    from clients.vault_client import VaultClient, get_database_url
+
+    app_url = get_database_url()
+    admin_url = VaultClient().get_secret("database", "admin_url")
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        yield app_url, admin_url
+        return
+
+    import psycopg
+    from psycopg import sql
+    from psycopg.conninfo import conninfo_to_dict, make_conninfo
+
+    template = conninfo_to_dict(app_url)["dbname"]
+    clone = f"{template}_{worker}"
+    maintenance_url = make_conninfo(admin_url, dbname="postgres")
+
+    with psycopg.connect(maintenance_url, autocommit=True) as conn:
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(clone)))
+        conn.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+            sql.Identifier(clone), sql.Identifier(template)
+        ))
+
+    yield make_conninfo(app_url, dbname=clone), make_conninfo(admin_url, dbname=clone)
+
+    with psycopg.connect(maintenance_url, autocommit=True) as conn:
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(clone)))
+
+
+@pytest.fixture(scope="session")
+def db(database_urls):
     """Session-scoped PostgresClient (application user, RLS enforced)."""
     from clients.postgres_client import PostgresClient
-    from clients.vault_client import get_database_url
 
-    client = PostgresClient(get_database_url())
+    client = PostgresClient(database_urls[0])
     yield client
     client.close()
 
 
 @pytest.fixture(scope="session")
-def db_admin():
+def db_admin(database_urls):
     """Session-scoped admin PostgresClient (bypasses RLS, for test setup/teardown)."""
     from clients.postgres_client import PostgresClient
-    from clients.vault_client import VaultClient
 
-    vault = VaultClient()
-    admin_url = vault.get_secret("database", "admin_url")
-    client = PostgresClient(admin_url)
+    client = PostgresClient(database_urls[1])
     yield client
     client.close()
 
 
 @pytest.fixture(scope="session")
-def db_url():
-    """Database URL from Vault."""
-    from clients.vault_client import get_database_url
-    return get_database_url()
+def db_url(database_urls):
+    """Application database URL (the per-worker clone under xdist)."""
+    return database_urls[0]
 
 
-@pytest.fixture(autouse=True)
-def reset_db_state(db_admin):
-    """Reset database state before each test using admin connection."""
-    if db_admin is None:
-        return
+# User-scoped tables, children before parents so plain DELETEs satisfy the
+# non-cascading foreign keys. ticket_technicians and
+# recurring_template_services cascade from their parents.
+_USER_DATA_TABLES = (
+    "audit_log", "model_authorization_queue", "recurring_templates",
+    "leads", "waitlist", "message_log", "scheduled_messages", "attributes",
+    "notes", "invoices", "line_items", "tickets", "services", "addresses",
+    "customers",
+)
+
 
-    # Truncate user-scoped tables (CASCADE handles foreign keys)
+@pytest.fixture(scope="session")
+def clean_db_session(db_admin):
+    """Start the session from empty user-scoped tables and both test users."""
     # Also truncate audit_log for test isolation (despite being append-only in prod)
     db_admin.execute("""
         TRUNCATE
             customers, addresses, services, tickets, ticket_technicians,
             line_items, invoices, notes, attributes, scheduled_messages,
-            waitlist, leads, recurring_templates, recurring_template_services,
+            message_log, waitlist, leads, recurring_templates, recurring_template_services,
             model_authorization_queue, audit_log
         CASCADE
     """)
 
-    # Ensure test users exist
+    # Ensure test users exist. users is not in _USER_DATA_TABLES and no test
+    # modifies these two rows, so once per session is enough.
     db_admin.execute("""
         INSERT INTO users (id, email, created_at, updated_at)
         VALUES
@@ -132,6 +186,18 @@ def reset_db_state(db_admin):
         ON CONFLICT (id) DO UPDATE SET email = EXCLUDED.email
     """, (TEST_USER_ID, TEST_USER_EMAIL, TEST_USER_B_ID, TEST_USER_B_EMAIL))
 
+
+@pytest.fixture(autouse=True)
+def reset_db_state(db_admin, clean_db_session):
+    """Reset database state before each test using admin connection."""
+    if db_admin is None:
+        return
+
+    # Tables are empty at session start, so everything present was written
+    # by earlier tests in this run. DELETE only touches those rows, where
+    # TRUNCATE would rewrite every relation.
+    db_admin.execute("; ".join(f"DELETE FROM {table}" for table in _USER_DATA_TABLES))
+
     yield
 
 
@@ -149,6 +215,276 @@ def as_test_user_b(test_user_b_id):
         yield test_user_b_id
 
 
+# =============================================================================
+# SERVICE FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def audit_logger(db):
+    """Session-scoped AuditLogger — holds nothing but the DB handle."""
+    from core.audit import AuditLogger
+    return AuditLogger(db)
+
+
+@pytest.fixture(scope="session")
+def address_service(db, audit_logger):
+    """Session-scoped AddressService (stateless)."""
+    from core.services.address_service import AddressService
+    return AddressService(db, audit_logger)
+
+
+@pytest.fixture(scope="session")
+def attribute_service(db, audit_logger):
+    """Session-scoped AttributeService (stateless)."""
+    from core.services.attribute_service import AttributeService
+    return AttributeService(db, audit_logger)
+
+
+@pytest.fixture(scope="session")
+def catalog_service(db, audit_logger):
+    """Session-scoped CatalogService (stateless)."""
+    from core.services.catalog_service import CatalogService
+    return CatalogService(db, audit_logger)
+
+
+@pytest.fixture(scope="session")
+def line_item_service(db, audit_logger):
+    """Session-scoped LineItemService (stateless)."""
+    from core.services.line_item_service import LineItemService
+    return LineItemService(db, audit_logger)
+
+
+@pytest.fixture(scope="session")
+def customer_service(db, audit_logger, event_bus):
+    """Session-scoped CustomerService on the shared EventBus."""
+    from core.services.customer_service import CustomerService
+    return CustomerService(db, audit_logger, event_bus)
+
+
+@pytest.fixture(scope="session")
+def note_service(db, audit_logger, event_bus):
+    """Session-scoped NoteService on the shared EventBus."""
+    from core.services.note_service import NoteService
+    return NoteService(db, audit_logger, event_bus)
+
+
+@pytest.fixture(scope="session")
+def invoice_service(db, audit_logger, event_bus):
+    """Session-scoped InvoiceService on the shared EventBus."""
+    from core.services.invoice_service import InvoiceService
+    return InvoiceService(db, audit_logger, event_bus)
+
+
+@pytest.fixture(scope="session")
+def ticket_service(db, audit_logger, event_bus):
+    """Session-scoped TicketService on the shared EventBus."""
+    from core.services.ticket_service import TicketService
+    return TicketService(db, audit_logger, event_bus)
+
+
+# =============================================================================
+# SEED FIXTURES
+# =============================================================================
+#
+# Each returns a callable that inserts rows a test only needs to exist with
+# raw SQL via _seed_rows: one INSERT per call, no validation, audit entry or
+# event. Callers
+# must already be inside a user context (e.g. via as_test_user). Tests about
+# the service that creates a row call that service directly.
+
+
+def _seed_rows(db, table: str, columns: list[str], rows: list[tuple], model) -> list:
+    """Insert rows into table with one multi-row INSERT ... RETURNING *.
+
+    Each row holds values for columns; a fresh id and the context user's id
+    are prepended. Returns model instances in input order ([] for no rows).
+    """
+    from uuid import uuid4
+    from utils.user_context import get_current_user_id
+
+    if not rows:
+        return []
+
+    user_id = get_current_user_id()
+    ids = [uuid4() for _ in rows]
+    placeholders = "(" + ", ".join(["%s"] * (len(columns) + 2)) + ")"
+    returned = db.execute_returning(
+        f"""
+        INSERT INTO {table} (id, user_id, {", ".join(columns)})
+        VALUES {", ".join([placeholders] * len(rows))}
+        RETURNING *
+        """,
+        tuple(value for row_id, row in zip(ids, rows) for value in (row_id, user_id, *row))
+    )
+    by_id = {row["id"]: model.model_validate(row) for row in returned}
+    return [by_id[row_id] for row_id in ids]
+
+
+@pytest.fixture
+def seed_customer(db):
+    """Seeder: seed_customer(first_name=...) -> Customer."""
+    from core.models import Customer
+
+    def seed(first_name="Test", last_name="Customer"):
+        return _seed_rows(
+            db, "customers", ["first_name", "last_name"], [(first_name, last_name)], Customer
+        )[0]
+
+    return seed
+
+
+@pytest.fixture
+def seed_customers(db):
+    """Seeder: seed_customers([CustomerCreate, ...]) -> list[Customer] (names and email only)."""
+    from core.models import Customer
+
+    def seed(items):
+        return _seed_rows(
+            db, "customers", ["first_name", "last_name", "email"],
+            [(item.first_name, item.last_name, item.email) for item in items],
+            Customer
+        )
+
+    return seed
+
+
+@pytest.fixture
+def seed_address(db):
+    """Seeder: seed_address(customer_id, street=...) -> Address (in Austin, TX)."""
+    from core.models import Address
+
+    def seed(customer_id, street="100 Test St"):
+        return _seed_rows(
+            db, "addresses", ["customer_id", "street", "city", "state", "zip"],
+            [(customer_id, street, "Austin", "TX", "78701")], Address
+        )[0]
+
+    return seed
+
+
+@pytest.fixture
+def seed_addresses(db):
+    """Seeder: seed_addresses([AddressCreate, ...]) -> list[Address]."""
+    from core.models import Address
+
+    def seed(items):
+        return _seed_rows(
+            db, "addresses", ["customer_id", "street", "city", "state", "zip"],
+            [(item.customer_id, item.street, item.city, item.state, item.zip) for item in items],
+            Address
+        )
+
+    return seed
+
+
+@pytest.fixture
+def seed_ticket(db):
+    """Seeder: seed_ticket(customer_id, address_id, scheduled_at=FUTURE_DT) -> Ticket."""
+    from core.models import Ticket
+
+    def seed(customer_id, address_id, scheduled_at=FUTURE_DT):
+        return _seed_rows(
+            db, "tickets", ["customer_id", "address_id", "scheduled_at"],
+            [(customer_id, address_id, scheduled_at)], Ticket
+        )[0]
+
+    return seed
+
+
+@pytest.fixture
+def seed_tickets(db):
+    """Seeder: seed_tickets([TicketCreate, ...]) -> list[Ticket]."""
+    from core.models import Ticket
+
+    def seed(items):
+        return _seed_rows(
+            db, "tickets",
+            [
+                "customer_id", "address_id", "scheduled_at",
+                "scheduled_duration_minutes", "is_price_estimated", "notes"
+            ],
+            [
+                (
+                    item.customer_id, item.address_id, item.scheduled_at,
+                    item.scheduled_duration_minutes, item.is_price_estimated, item.notes
+                )
+                for item in items
+            ],
+            Ticket
+        )
+
+    return seed
+
+
+@pytest.fixture
+def seed_notes(db):
+    """Seeder: seed_notes([NoteCreate, ...]) -> list[Note]."""
+    from core.models import Note
+
+    def seed(items):
+        return _seed_rows(
+            db, "notes", ["customer_id", "ticket_id", "content"],
+            [(item.customer_id, item.ticket_id, item.content) for item in items],
+            Note
+        )
+
+    return seed
+
+
+@pytest.fixture
+def seed_line_items(db):
+    """Seeder: seed_line_items(ticket_id, [LineItemCreate, ...]) -> list[LineItem].
+
+    Each item needs a resolvable total_price_cents (no service default lookup).
+    """
+    from core.models import LineItem
+
+    def seed(ticket_id, items):
+        return _seed_rows(
+            db, "line_items",
+            [
+                "ticket_id", "service_id", "description",
+                "quantity", "unit_price_cents", "total_price_cents", "duration_minutes"
+            ],
+            [
+                (
+                    ticket_id, item.service_id, item.description,
+                    item.quantity, item.unit_price_cents, item.total_price_cents, item.duration_minutes
+                )
+                for item in items
+            ],
+            LineItem
+        )
+
+    return seed
+
+
+@pytest.fixture
+def seed_messages(db):
+    """Seeder: seed_messages([ScheduledMessageCreate, ...]) -> list[ScheduledMessage], all PENDING."""
+    from core.models import ScheduledMessage
+
+    def seed(items):
+        return _seed_rows(
+            db, "scheduled_messages",
+            [
+                "customer_id", "ticket_id", "message_type",
+                "template_name", "subject", "body", "scheduled_for"
+            ],
+            [
+                (
+                    item.customer_id, item.ticket_id, item.message_type.value,
+                    item.template_name, item.subject, item.body, item.scheduled_for
+                )
+                for item in items
+            ],
+            ScheduledMessage
+        )
+
+    return seed
+
+
 # =============================================================================
 # VALKEY FIXTURES
 # =============================================================================
@@ -20,52 +20,9 @@ from utils.timezone import now_utc
 
 
 @pytest.fixture
-def message_service(db):
+def message_service(db, audit_logger):
     from core.services.message_service import MessageService
-    from core.audit import AuditLogger
-    return MessageService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-    return CustomerService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def ticket_service(db, event_bus):
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-    return TicketService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def address_service(db):
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
-    return AddressService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def line_item_service(db):
-    from core.services.line_item_service import LineItemService
-    from core.audit import AuditLogger
-    return LineItemService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def catalog_service(db):
-    from core.services.catalog_service import CatalogService
-    from core.audit import AuditLogger
-    return CatalogService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def invoice_service(db, event_bus):
-    from core.services.invoice_service import InvoiceService
-    from core.audit import AuditLogger
-    return InvoiceService(db, AuditLogger(db), event_bus)
+    return MessageService(db, audit_logger)
 
 
 @pytest.fixture
@@ -130,11 +87,9 @@ class TestInvoicePaymentHandler:
         event = InvoicePaid(invoice=test_invoice)
         handler(event)
 
-        messages = message_service.list_for_customer(test_customer.id)
-        receipt_messages = [
-            m for m in messages
-            if test_invoice.invoice_number in (m.body or "")
-        ]
+        receipt_messages = message_service.list_for_customer(
+            test_customer.id, body_contains=test_invoice.invoice_number
+        )
 
         assert len(receipt_messages) == 1
         msg = receipt_messages[0]
@@ -149,17 +104,18 @@ class TestInvoicePaymentHandler:
         event = InvoicePaid(invoice=test_invoice)
         handler(event)
 
-        messages = message_service.list_for_customer(test_customer.id)
-        assert any(test_invoice.invoice_number in (m.body or "") for m in messages)
+        assert message_service.count_for_customer(
+            test_customer.id, body_contains=test_invoice.invoice_number
+        ) == 1
 
     def test_schedules_exactly_one_message(
         self, db, as_test_user, handler, message_service, test_customer, test_invoice
     ):
         # Count before
-        before = len(message_service.list_for_customer(test_customer.id))
+        before = message_service.count_for_customer(test_customer.id)
 
         event = InvoicePaid(invoice=test_invoice)
         handler(event)
 
-        after = len(message_service.list_for_customer(test_customer.id))
+        after = message_service.count_for_customer(test_customer.id)
         assert after - before == 1
@@ -19,31 +19,9 @@ from utils.timezone import now_utc
 
 
 @pytest.fixture
-def message_service(db):
+def message_service(db, audit_logger):
     from core.services.message_service import MessageService
-    from core.audit import AuditLogger
-    return MessageService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-    return CustomerService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def ticket_service(db, event_bus):
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-    return TicketService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def address_service(db):
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
-    return AddressService(db, AuditLogger(db))
+    return MessageService(db, audit_logger)
 
 
 @pytest.fixture
@@ -3,205 +3,218 @@
 On TicketCompleted: extract attributes from unprocessed notes,
 persist them via real services, and mark notes as processed.
 
-Only the LLM extractor is mocked — it's the external boundary.
+Only the LLM extractor is faked — it's the external boundary.
 All other services use real DB-backed instances.
 """
 
-from datetime import timedelta
 from decimal import Decimal
-from unittest.mock import Mock
 
 import pytest
 
 from core.events import TicketCompleted
 from core.handlers.ticket_completion_handler import handle_ticket_completed
-from core.models import (
-    CustomerCreate, TicketCreate, NoteCreate,
-    AttributeCreate,
-)
+from core.models import NoteCreate
 from core.models.attribute import ExtractedAttributes
-from utils.timezone import now_utc
 
+# Extractor results are immutable inputs — build them once for the module
+CONFIDENCE = Decimal("0.80")
 
-@pytest.fixture
-def note_service(db, event_bus):
-    from core.services.note_service import NoteService
-    from core.audit import AuditLogger
-    return NoteService(db, AuditLogger(db), event_bus)
+PET_EXTRACTION = ExtractedAttributes(
+    attributes={"pet": {"type": "dog", "name": "Biscuit"}, "customer_demographic": "elderly"},
+    raw_response='{"pet": {"type": "dog", "name": "Biscuit"}, "customer_demographic": "elderly"}',
+    confidence=CONFIDENCE,
+)
 
+EMPTY_EXTRACTION = ExtractedAttributes(
+    attributes={}, raw_response="{}", confidence=CONFIDENCE,
+)
 
-@pytest.fixture
-def attribute_service(db):
-    from core.services.attribute_service import AttributeService
-    from core.audit import AuditLogger
-    return AttributeService(db, AuditLogger(db))
 
+def fetch_handler_state(db, customer_id, ticket_id) -> dict:
+    """Everything the handler wrote, in one round trip.
+
+    Returns {"attrs": {key: {value, source_type, source_note_id, confidence}},
+    "unprocessed_notes": int}. confidence comes back as text to keep Decimal
+    precision through JSON.
+    """
+    return db.execute_scalar(
+        """
+        SELECT json_build_object(
+            'attrs', (
+                SELECT COALESCE(json_object_agg(key, json_build_object(
+                    'value', value,
+                    'source_type', source_type,
+                    'source_note_id', source_note_id,
+                    'confidence', confidence::text
+                )), '{}'::json)
+                FROM attributes WHERE customer_id = %s
+            ),
+            'unprocessed_notes', (
+                SELECT COUNT(*) FROM notes
+                WHERE ticket_id = %s AND processed_at IS NULL AND deleted_at IS NULL
+            )
+        )
+        """,
+        (customer_id, ticket_id)
+    )
 
-@pytest.fixture
-def customer_service(db, event_bus):
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-    return CustomerService(db, AuditLogger(db), event_bus)
 
+class FakeExtractor:
+    """Stands in for AttributeExtractor: returns a fixed result, records each batch call."""
 
-@pytest.fixture
-def ticket_service(db, event_bus):
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-    return TicketService(db, AuditLogger(db), event_bus)
+    __slots__ = ("result", "calls")
 
+    BATCH_SIZE = 2
 
-@pytest.fixture
-def address_service(db):
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
-    return AddressService(db, AuditLogger(db))
+    def __init__(self, result: ExtractedAttributes):
+        self.result = result
+        self.calls: list[list[str]] = []
+
+    def extract_attributes_batch(self, notes: list[str]) -> list[ExtractedAttributes]:
+        self.calls.append(list(notes))
+        return [self.result] * len(notes)
 
 
 @pytest.fixture
-def mock_extractor():
-    return Mock()
+def fake_extractor():
+    return FakeExtractor(EMPTY_EXTRACTION)
 
 
+# Customer/address/ticket are scaffolding here, so seed them with raw SQL
 @pytest.fixture
-def test_customer(as_test_user, customer_service):
-    return customer_service.create(CustomerCreate(first_name="Handler", last_name="Test"))
+def test_customer(as_test_user, seed_customer):
+    return seed_customer(first_name="Handler", last_name="Test")
 
 
 @pytest.fixture
-def test_address(as_test_user, address_service, test_customer):
-    from core.models import AddressCreate
-    return address_service.create(AddressCreate(
-        customer_id=test_customer.id,
-        street="100 Handler St", city="Austin", state="TX", zip="78701"
-    ))
+def test_address(as_test_user, seed_address, test_customer):
+    return seed_address(test_customer.id, street="100 Handler St")
 
 
 @pytest.fixture
-def test_ticket(as_test_user, ticket_service, test_customer, test_address):
-    return ticket_service.create(TicketCreate(
-        customer_id=test_customer.id,
-        address_id=test_address.id,
-        scheduled_at=now_utc() + timedelta(days=1)
-    ))
+def test_ticket(as_test_user, seed_ticket, test_customer, test_address):
+    return seed_ticket(test_customer.id, test_address.id)
 
 
 @pytest.fixture
-def handler(mock_extractor, attribute_service, note_service):
-    return handle_ticket_completed(mock_extractor, attribute_service, note_service)
+def handler(fake_extractor, attribute_service, note_service):
+    return handle_ticket_completed(fake_extractor, attribute_service, note_service)
 
 
 class TestTicketCompletionHandler:
 
-    def test_extracts_and_persists_attributes_from_note(
-        self, db, as_test_user, handler, mock_extractor,
-        note_service, attribute_service,
-        test_customer, test_ticket
+    @pytest.mark.parametrize("note_count", [1, 2, 5])
+    def test_extracts_and_persists_attributes_from_notes(
+        self, db, as_test_user, handler, fake_extractor,
+        note_service, test_customer, test_ticket, note_count
     ):
-        """Full integration: note created → handler extracts → attributes persisted in DB."""
-        note = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="Elderly woman, dog named Biscuit"
-        ))
+        """Full integration: notes created → handler extracts each → attributes persisted in DB."""
+        notes = [
+            note_service.create(NoteCreate(
+                ticket_id=test_ticket.id,
+                content=f"Elderly woman, dog named Biscuit ({i})"
+            ))
+            for i in range(note_count)
+        ]
 
-        mock_extractor.extract_attributes.return_value = ExtractedAttributes(
-            attributes={"pet": {"type": "dog", "name": "Biscuit"}, "customer_demographic": "elderly"},
-            raw_response='{"pet": {"type": "dog", "name": "Biscuit"}, "customer_demographic": "elderly"}',
-            confidence=Decimal("0.80"),
-        )
+        fake_extractor.result = PET_EXTRACTION
 
         event = TicketCompleted(ticket=test_ticket)
         handler(event)
 
-        # Extractor called with exact note content
-        mock_extractor.extract_attributes.assert_called_once_with("Elderly woman, dog named Biscuit")
+        # One extractor call per BATCH_SIZE notes with their exact content, oldest first
+        contents = [note.content for note in notes]
+        assert fake_extractor.calls == [
+            contents[start:start + FakeExtractor.BATCH_SIZE]
+            for start in range(0, note_count, FakeExtractor.BATCH_SIZE)
+        ]
 
-        # Attributes actually persisted in DB
-        attrs = attribute_service.list_for_customer(test_customer.id)
-        attr_keys = {a.key for a in attrs}
-        assert "pet" in attr_keys
-        assert "customer_demographic" in attr_keys
-
-        pet_attr = next(a for a in attrs if a.key == "pet")
-        assert pet_attr.value == {"type": "dog", "name": "Biscuit"}
-        assert pet_attr.source_type == "llm_extracted"
-        assert pet_attr.source_note_id == note.id
-        assert pet_attr.confidence == Decimal("0.80")
-
-        # Note actually marked processed in DB
-        updated_note = note_service.get_by_id(note.id)
-        assert updated_note.processed_at is not None
-
-    def test_processes_multiple_notes_and_marks_each_processed(
-        self, db, as_test_user, handler, mock_extractor,
-        note_service, test_customer, test_ticket
-    ):
-        note_1 = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id, content="Note one"
-        ))
-        note_2 = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id, content="Note two"
-        ))
+        state = fetch_handler_state(db, test_customer.id, test_ticket.id)
 
-        mock_extractor.extract_attributes.return_value = ExtractedAttributes(
-            attributes={"key": "val"},
-            raw_response='{"key": "val"}',
-            confidence=Decimal("0.80"),
-        )
-
-        event = TicketCompleted(ticket=test_ticket)
-        handler(event)
+        # Attributes actually persisted in DB
+        assert state["attrs"]["customer_demographic"]["value"] == "elderly"
 
-        assert mock_extractor.extract_attributes.call_count == 2
+        # Later notes upsert over earlier ones
+        pet_attr = state["attrs"]["pet"]
+        assert pet_attr["value"] == {"type": "dog", "name": "Biscuit"}
+        assert pet_attr["source_type"] == "llm_extracted"
+        assert pet_attr["source_note_id"] == str(notes[-1].id)
+        assert Decimal(pet_attr["confidence"]) == CONFIDENCE
 
-        assert note_service.get_by_id(note_1.id).processed_at is not None
-        assert note_service.get_by_id(note_2.id).processed_at is not None
+        # Every note actually marked processed in DB
+        assert state["unprocessed_notes"] == 0
 
     def test_skips_already_processed_notes(
-        self, db, as_test_user, handler, mock_extractor,
+        self, db, as_test_user, handler, fake_extractor,
         note_service, test_ticket
     ):
         """Already-processed notes are excluded at the SQL level."""
         processed_note = note_service.create(NoteCreate(
             ticket_id=test_ticket.id, content="Already done"
         ))
-        note_service.mark_processed(processed_note.id)
+        # Arrange-only state change; mark_processed itself is covered in note service tests
+        db.execute(
+            "UPDATE notes SET processed_at = now() WHERE id = %s",
+            (processed_note.id,)
+        )
 
         unprocessed_note = note_service.create(NoteCreate(
             ticket_id=test_ticket.id, content="Still fresh"
         ))
 
-        mock_extractor.extract_attributes.return_value = ExtractedAttributes(
-            attributes={}, raw_response="{}", confidence=Decimal("0.80"),
-        )
+        fake_extractor.result = EMPTY_EXTRACTION
 
         event = TicketCompleted(ticket=test_ticket)
         handler(event)
 
         # Only the unprocessed note should trigger extraction
-        mock_extractor.extract_attributes.assert_called_once_with("Still fresh")
+        assert fake_extractor.calls == [["Still fresh"]]
 
     def test_no_notes_does_not_call_extractor(
-        self, db, as_test_user, handler, mock_extractor, test_ticket
+        self, as_test_user, handler, fake_extractor, test_ticket
     ):
         event = TicketCompleted(ticket=test_ticket)
         handler(event)
 
-        mock_extractor.extract_attributes.assert_not_called()
+        assert fake_extractor.calls == []
 
     def test_empty_extraction_still_marks_note_processed(
-        self, db, as_test_user, handler, mock_extractor,
+        self, as_test_user, handler, fake_extractor,
         note_service, test_ticket
     ):
         note = note_service.create(NoteCreate(
             ticket_id=test_ticket.id, content="Nothing useful"
         ))
 
-        mock_extractor.extract_attributes.return_value = ExtractedAttributes(
-            attributes={}, raw_response="{}", confidence=Decimal("0.80"),
-        )
+        fake_extractor.result = EMPTY_EXTRACTION
 
         event = TicketCompleted(ticket=test_ticket)
         handler(event)
 
         assert note_service.get_by_id(note.id).processed_at is not None
+
+    def test_failed_batch_keeps_earlier_batches_processed(
+        self, db, as_test_user, attribute_service, note_service, test_customer, test_ticket
+    ):
+        """A later batch failing leaves earlier batches persisted and processed."""
+
+        class FailsOnSecondBatch(FakeExtractor):
+            __slots__ = ()
+
+            def extract_attributes_batch(self, notes):
+                if self.calls:
+                    raise RuntimeError("LLM unavailable")
+                return super().extract_attributes_batch(notes)
+
+        for i in range(FakeExtractor.BATCH_SIZE + 1):
+            note_service.create(NoteCreate(ticket_id=test_ticket.id, content=f"Note {i}"))
+
+        handler = handle_ticket_completed(
+            FailsOnSecondBatch(PET_EXTRACTION), attribute_service, note_service
+        )
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            handler(TicketCompleted(ticket=test_ticket))
+
+        state = fetch_handler_state(db, test_customer.id, test_ticket.id)
+        assert state["unprocessed_notes"] == 1
+        assert state["attrs"]["customer_demographic"]["value"] == "elderly"
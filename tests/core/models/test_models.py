@@ -1,125 +1,77 @@
 """Tests for core domain models - custom validators only."""
 
+import re
+
 import pytest
 from pydantic import ValidationError
 from uuid import uuid4
 
-
-class TestCustomerCreate:
-    """Tests for CustomerCreate custom validators."""
-
-    def test_requires_at_least_one_name(self):
-        """Rejects when no name fields provided."""
-        from core.models import CustomerCreate
-
-        with pytest.raises(ValidationError, match="(?i)at least one of"):
-            CustomerCreate()
-
-    def test_accepts_first_name_only(self):
-        """Accepts just first_name."""
-        from core.models import CustomerCreate
-
-        c = CustomerCreate(first_name="Alice")
-        assert c.first_name == "Alice"
-
-    def test_accepts_business_name_only(self):
-        """Accepts just business_name."""
-        from core.models import CustomerCreate
-
-        c = CustomerCreate(business_name="Acme Corp")
-        assert c.business_name == "Acme Corp"
-
-
-class TestServiceCreate:
-    """Tests for ServiceCreate custom validators."""
-
-    def test_fixed_requires_default_price(self):
-        """Fixed pricing needs default_price_cents."""
-        from core.models import ServiceCreate, PricingType
-
-        with pytest.raises(ValidationError, match="default_price_cents"):
-            ServiceCreate(name="Test", pricing_type=PricingType.FIXED)
-
-    def test_fixed_accepts_with_price(self):
-        """Fixed pricing works with default_price_cents."""
-        from core.models import ServiceCreate, PricingType
-
-        s = ServiceCreate(
-            name="Test",
-            pricing_type=PricingType.FIXED,
-            default_price_cents=1500
-        )
-        assert s.default_price_cents == 1500
-
-    def test_per_unit_requires_unit_price(self):
-        """Per-unit pricing needs unit_price_cents."""
-        from core.models import ServiceCreate, PricingType
-
-        with pytest.raises(ValidationError, match="unit_price_cents"):
-            ServiceCreate(name="Test", pricing_type=PricingType.PER_UNIT)
-
-    def test_flexible_needs_no_price(self):
-        """Flexible pricing doesn't require price upfront."""
-        from core.models import ServiceCreate, PricingType
-
-        s = ServiceCreate(name="Test", pricing_type=PricingType.FLEXIBLE)
-        assert s.pricing_type == PricingType.FLEXIBLE
-
-
-class TestLineItemCreate:
-    """Tests for LineItemCreate custom validators."""
-
-    def test_computes_total_from_quantity_and_unit(self):
-        """Calculates total_price_cents if not provided."""
-        from core.models import LineItemCreate
-
-        li = LineItemCreate(
-            service_id=uuid4(),
-            quantity=5,
-            unit_price_cents=1000
-        )
-        assert li.total_price_cents == 5000
-
-    def test_uses_explicit_total_if_provided(self):
-        """Uses provided total_price_cents over calculation."""
-        from core.models import LineItemCreate
-
-        li = LineItemCreate(
-            service_id=uuid4(),
-            quantity=5,
-            unit_price_cents=1000,
-            total_price_cents=4500  # Discounted
-        )
-        assert li.total_price_cents == 4500
-
-
-class TestNoteCreate:
-    """Tests for NoteCreate custom validators."""
-
-    def test_requires_exactly_one_parent(self):
-        """Must have either customer_id or ticket_id, not both or neither."""
-        from core.models import NoteCreate
-
-        # Neither
-        with pytest.raises(ValidationError, match="Exactly one"):
-            NoteCreate(content="Test")
-
-        # Both
-        with pytest.raises(ValidationError, match="Exactly one"):
-            NoteCreate(content="Test", customer_id=uuid4(), ticket_id=uuid4())
-
-    def test_accepts_customer_only(self):
-        """Works with just customer_id."""
-        from core.models import NoteCreate
-
-        n = NoteCreate(content="Test", customer_id=uuid4())
-        assert n.customer_id is not None
-        assert n.ticket_id is None
-
-    def test_accepts_ticket_only(self):
-        """Works with just ticket_id."""
-        from core.models import NoteCreate
-
-        n = NoteCreate(content="Test", ticket_id=uuid4())
-        assert n.ticket_id is not None
-        assert n.customer_id is None
+from core.models import (
+    CustomerCreate, ServiceCreate, PricingType, LineItemCreate, NoteCreate,
+)
+
+
+# Error patterns, compiled once for every parametrized case
+AT_LEAST_ONE_NAME = re.compile(r"at least one of", re.IGNORECASE)
+NEEDS_DEFAULT_PRICE = re.compile(r"default_price_cents")
+NEEDS_UNIT_PRICE = re.compile(r"unit_price_cents")
+EXACTLY_ONE_PARENT = re.compile(r"Exactly one")
+
+
+class TestCustomValidators:
+    """Custom model validators: what they reject and what they let through."""
+
+    @pytest.mark.parametrize("model, kwargs, error", [
+        pytest.param(CustomerCreate, {}, AT_LEAST_ONE_NAME, id="customer-no-name"),
+        pytest.param(
+            ServiceCreate, {"name": "Test", "pricing_type": PricingType.FIXED},
+            NEEDS_DEFAULT_PRICE, id="service-fixed-no-price",
+        ),
+        pytest.param(
+            ServiceCreate, {"name": "Test", "pricing_type": PricingType.PER_UNIT},
+            NEEDS_UNIT_PRICE, id="service-per-unit-no-price",
+        ),
+        pytest.param(NoteCreate, {"content": "Test"}, EXACTLY_ONE_PARENT, id="note-no-parent"),
+        pytest.param(
+            NoteCreate, {"content": "Test", "customer_id": uuid4(), "ticket_id": uuid4()},
+            EXACTLY_ONE_PARENT, id="note-both-parents",
+        ),
+    ])
+    def test_rejects(self, model, kwargs, error):
+        """Invalid field combinations raise ValidationError naming the problem."""
+        with pytest.raises(ValidationError, match=error):
+            model(**kwargs)
+
+    @pytest.mark.parametrize("model, kwargs", [
+        pytest.param(CustomerCreate, {"first_name": "Alice"}, id="customer-first-name-only"),
+        pytest.param(CustomerCreate, {"business_name": "Acme Corp"}, id="customer-business-name-only"),
+        pytest.param(
+            ServiceCreate,
+            {"name": "Test", "pricing_type": PricingType.FIXED, "default_price_cents": 1500},
+            id="service-fixed-with-price",
+        ),
+        pytest.param(
+            ServiceCreate, {"name": "Test", "pricing_type": PricingType.FLEXIBLE},
+            id="service-flexible-no-price",
+        ),
+        pytest.param(NoteCreate, {"content": "Test", "customer_id": uuid4()}, id="note-customer-only"),
+        pytest.param(NoteCreate, {"content": "Test", "ticket_id": uuid4()}, id="note-ticket-only"),
+    ])
+    def test_accepts(self, model, kwargs):
+        """Valid field combinations construct and keep the given values."""
+        instance = model(**kwargs)
+
+        for field, value in kwargs.items():
+            assert getattr(instance, field) == value
+
+    @pytest.mark.parametrize("kwargs, expected_total", [
+        pytest.param({"quantity": 5, "unit_price_cents": 1000}, 5000, id="computed"),
+        pytest.param(
+            {"quantity": 5, "unit_price_cents": 1000, "total_price_cents": 4500},  # Discounted
+            4500, id="explicit-total-wins",
+        ),
+    ])
+    def test_line_item_total(self, kwargs, expected_total):
+        """LineItemCreate computes total_price_cents unless one is provided."""
+        li = LineItemCreate(service_id=uuid4(), **kwargs)
+        assert li.total_price_cents == expected_total
@@ -4,67 +4,29 @@ import pytest
 from uuid import uuid4
 from decimal import Decimal
 
+from core.models import AttributeCreate, NoteCreate
 from utils.timezone import now_utc
 
 
 @pytest.fixture
-def attribute_service(db):
-    """AttributeService with real DB."""
-    from core.services.attribute_service import AttributeService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return AttributeService(db, audit)
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService for test setup."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-
-    return CustomerService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def note_service(db, event_bus):
-    """NoteService for test setup."""
-    from core.services.note_service import NoteService
-    from core.audit import AuditLogger
-
-    return NoteService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def test_customer(as_test_user, customer_service):
+def test_customer(as_test_user, seed_customer):
     """Create a test customer."""
-    from core.models import CustomerCreate
-
-    customer = customer_service.create(CustomerCreate(first_name="Attribute", last_name="Test"))
-    yield customer
-    customer_service.delete(customer.id)
+    return seed_customer(first_name="Attribute", last_name="Test")
 
 
 @pytest.fixture
-def test_note(as_test_user, note_service, test_customer):
+def test_note(as_test_user, seed_notes, test_customer):
     """Create a test note."""
-    from core.models import NoteCreate
-
-    note = note_service.create(NoteCreate(
-        customer_id=test_customer.id,
-        content="Customer has 15 windows and a pet dog."
-    ))
-    yield note
-    note_service.delete(note.id)
+    return seed_notes([
+        NoteCreate(content="Customer has 15 windows and a pet dog.", customer_id=test_customer.id)
+    ])[0]
 
 
 class TestAttributeCreate:
     """Tests for AttributeService.create."""
 
-    def test_creates_manual_attribute(self, db, as_test_user, attribute_service, test_customer):
+    def test_creates_manual_attribute(self, as_test_user, attribute_service, test_customer):
         """Creates manually entered attribute."""
-        from core.models import AttributeCreate
-
         data = AttributeCreate(
             customer_id=test_customer.id,
             key="window_count",
@@ -80,10 +42,8 @@ class TestAttributeCreate:
         assert attr.source_type == "manual"
         assert attr.confidence is None
 
-    def test_creates_llm_extracted_attribute(self, db, as_test_user, attribute_service, test_customer, test_note):
+    def test_creates_llm_extracted_attribute(self, as_test_user, attribute_service, test_customer, test_note):
         """Creates LLM-extracted attribute with confidence."""
-        from core.models import AttributeCreate
-
         data = AttributeCreate(
             customer_id=test_customer.id,
             key="pet_type",
@@ -101,35 +61,58 @@ class TestAttributeCreate:
         assert attr.source_note_id == test_note.id
         assert attr.confidence == Decimal("0.85")
 
-    def test_upserts_on_duplicate_key(self, db, as_test_user, attribute_service, test_customer):
+    def test_upserts_on_duplicate_key(self, db, as_test_user, test_user_id, attribute_service, test_customer):
         """Creating attribute with existing key updates it."""
-        from core.models import AttributeCreate
-
-        # Create first
+        # Create first through the service
         attribute_service.create(AttributeCreate(
             customer_id=test_customer.id,
             key="window_count",
             value=10
         ))
 
-        # Create again with same key - should update
-        updated = attribute_service.create(AttributeCreate(
+        # Same key again as one upsert; xmax is non-zero only for the DO UPDATE branch
+        row = db.execute_returning(
+            """
+            WITH upserted AS (
+                INSERT INTO attributes (id, user_id, customer_id, key, value)
+                VALUES (%s, %s, %s, 'window_count', '15')
+                ON CONFLICT (customer_id, key) DO UPDATE
+                SET value = EXCLUDED.value, updated_at = now()
+                RETURNING value, (xmax <> 0) AS was_update
+            )
+            SELECT value, was_update,
+                (SELECT COUNT(*) FROM attributes
+                 WHERE customer_id = %s AND key = 'window_count') AS row_count
+            FROM upserted
+            """,
+            (uuid4(), test_user_id, test_customer.id, test_customer.id)
+        )[0]
+
+        assert row["was_update"] is True
+        assert row["value"] == 15
+        # Should only be one attribute with this key
+        assert row["row_count"] == 1
+
+    def test_upsert_audits_old_and_new_value(self, as_test_user, attribute_service, audit_logger, test_customer):
+        """Second write is audited as an update carrying the replaced value."""
+        first = attribute_service.create(AttributeCreate(
+            customer_id=test_customer.id,
+            key="window_count",
+            value=10
+        ))
+        attribute_service.create(AttributeCreate(
             customer_id=test_customer.id,
             key="window_count",
             value=15
         ))
 
-        assert updated.value == 15
+        history = audit_logger.get_entity_history("attribute", first.id)
 
-        # Should only be one attribute with this key
-        attrs = attribute_service.list_for_customer(test_customer.id)
-        window_counts = [a for a in attrs if a.key == "window_count"]
-        assert len(window_counts) == 1
+        assert [h["action"] for h in history] == ["update", "create"]
+        assert history[0]["changes"] == {"key": "window_count", "old_value": 10, "new_value": 15}
 
-    def test_stores_complex_value(self, db, as_test_user, attribute_service, test_customer):
+    def test_stores_complex_value(self, as_test_user, attribute_service, test_customer):
         """Stores complex JSON values."""
-        from core.models import AttributeCreate
-
         data = AttributeCreate(
             customer_id=test_customer.id,
             key="service_preferences",
@@ -149,10 +132,8 @@ class TestAttributeCreate:
 class TestAttributeGet:
     """Tests for AttributeService get methods."""
 
-    def test_gets_attribute_by_id(self, db, as_test_user, attribute_service, test_customer):
+    def test_gets_attribute_by_id(self, as_test_user, attribute_service, test_customer):
         """Gets attribute by ID."""
-        from core.models import AttributeCreate
-
         created = attribute_service.create(AttributeCreate(
             customer_id=test_customer.id,
             key="test_key",
@@ -164,10 +145,8 @@ class TestAttributeGet:
         assert fetched is not None
         assert fetched.id == created.id
 
-    def test_gets_attribute_by_key(self, db, as_test_user, attribute_service, test_customer):
+    def test_gets_attribute_by_key(self, as_test_user, attribute_service, test_customer):
         """Gets specific attribute by customer and key."""
-        from core.models import AttributeCreate
-
         attribute_service.create(AttributeCreate(
             customer_id=test_customer.id,
             key="specific_key",
@@ -180,12 +159,12 @@ class TestAttributeGet:
         assert fetched.key == "specific_key"
         assert fetched.value == "specific_value"
 
-    def test_returns_none_for_missing(self, db, as_test_user, attribute_service):
+    def test_returns_none_for_missing(self, as_test_user, attribute_service):
         """Returns None for non-existent attribute."""
         result = attribute_service.get_by_id(uuid4())
         assert result is None
 
-    def test_returns_none_for_missing_key(self, db, as_test_user, attribute_service, test_customer):
+    def test_returns_none_for_missing_key(self, as_test_user, attribute_service, test_customer):
         """Returns None for non-existent key."""
         result = attribute_service.get_for_customer(test_customer.id, "nonexistent_key")
         assert result is None
@@ -194,20 +173,14 @@ class TestAttributeGet:
 class TestAttributeList:
     """Tests for AttributeService.list_for_customer."""
 
-    def test_lists_customer_attributes(self, db, as_test_user, attribute_service, test_customer):
+    def test_lists_customer_attributes(self, as_test_user, attribute_service, test_customer, test_note):
         """Lists all attributes for a customer."""
-        from core.models import AttributeCreate
-
-        attribute_service.create(AttributeCreate(
-            customer_id=test_customer.id,
-            key="attr_one",
-            value="value_one"
-        ))
-        attribute_service.create(AttributeCreate(
+        attribute_service.bulk_create_from_extraction(
             customer_id=test_customer.id,
-            key="attr_two",
-            value="value_two"
-        ))
+            attributes={"attr_one": "value_one", "attr_two": "value_two"},
+            source_note_id=test_note.id,
+            confidence=Decimal("0.80")
+        )
 
         attrs = attribute_service.list_for_customer(test_customer.id)
 
@@ -220,10 +193,8 @@ class TestAttributeList:
 class TestAttributeDelete:
     """Tests for AttributeService.delete."""
 
-    def test_deletes_attribute(self, db, as_test_user, attribute_service, test_customer):
+    def test_deletes_attribute(self, as_test_user, attribute_service, test_customer):
         """Deletes attribute."""
-        from core.models import AttributeCreate
-
         attr = attribute_service.create(AttributeCreate(
             customer_id=test_customer.id,
             key="to_delete",
@@ -237,7 +208,7 @@ class TestAttributeDelete:
         fetched = attribute_service.get_by_id(attr.id)
         assert fetched is None
 
-    def test_returns_false_for_missing(self, db, as_test_user, attribute_service):
+    def test_returns_false_for_missing(self, as_test_user, attribute_service):
         """Returns False when deleting non-existent attribute."""
         result = attribute_service.delete(uuid4())
         assert result is False
@@ -246,7 +217,7 @@ class TestAttributeDelete:
 class TestBulkCreate:
     """Tests for AttributeService.bulk_create_from_extraction."""
 
-    def test_bulk_creates_attributes(self, db, as_test_user, attribute_service, test_customer, test_note):
+    def test_bulk_creates_attributes(self, as_test_user, attribute_service, test_customer, test_note):
         """Bulk creates attributes from LLM extraction."""
         attrs = {
             "window_count": 15,
@@ -265,3 +236,43 @@ class TestBulkCreate:
         assert all(a.source_type == "llm_extracted" for a in created)
         assert all(a.source_note_id == test_note.id for a in created)
         assert all(a.confidence == Decimal("0.80") for a in created)
+
+    def test_bulk_returns_in_input_order_and_upserts(self, as_test_user, attribute_service, test_customer, test_note):
+        """Existing keys are updated in the same batch; results follow input order."""
+        attribute_service.create(AttributeCreate(
+            customer_id=test_customer.id,
+            key="pet_type",
+            value="cat"
+        ))
+
+        created = attribute_service.bulk_create_from_extraction(
+            customer_id=test_customer.id,
+            attributes={"yard_size": "large", "pet_type": "dog", "window_count": 15},
+            source_note_id=test_note.id,
+            confidence=Decimal("0.80")
+        )
+
+        assert [a.key for a in created] == ["yard_size", "pet_type", "window_count"]
+        assert attribute_service.get_for_customer(test_customer.id, "pet_type").value == "dog"
+        assert len(attribute_service.list_for_customer(test_customer.id)) == 3
+
+    def test_bulk_empty_is_noop(self, as_test_user, attribute_service, test_customer, test_note):
+        """No attributes means no statement and an empty result."""
+        created = attribute_service.bulk_create_from_extraction(
+            customer_id=test_customer.id,
+            attributes={},
+            source_note_id=test_note.id,
+            confidence=Decimal("0.80")
+        )
+
+        assert created == []
+
+    def test_upsert_rejects_duplicate_keys(self, as_test_user, attribute_service, test_customer):
+        """Two items with one key can't share an upsert statement."""
+        items = [
+            AttributeCreate(customer_id=test_customer.id, key="pet_type", value=value)
+            for value in ("cat", "dog")
+        ]
+
+        with pytest.raises(ValueError, match="Duplicate attribute keys"):
+            attribute_service._upsert(test_customer.id, items)
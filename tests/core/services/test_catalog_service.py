@@ -1,17 +1,11 @@
 """Tests for CatalogService (service catalog)."""
 
-import pytest
-from uuid import uuid4
+from uuid import UUID
 
+from core.models import ServiceCreate, PricingType, ServiceUpdate
 
-@pytest.fixture
-def catalog_service(db):
-    """CatalogService with real DB."""
-    from core.services.catalog_service import CatalogService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return CatalogService(db, audit)
+# Nil UUID: never issued by uuid4(), so it never matches a row
+MISSING_ID = UUID("00000000-0000-0000-0000-000000000000")
 
 
 class TestServiceCreate:
@@ -19,8 +13,6 @@ class TestServiceCreate:
 
     def test_creates_fixed_price_service(self, db, as_test_user, catalog_service):
         """Creates service with fixed pricing."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Window Cleaning",
             pricing_type=PricingType.FIXED,
@@ -35,8 +27,6 @@ class TestServiceCreate:
 
     def test_creates_per_unit_service(self, db, as_test_user, catalog_service):
         """Creates service with per-unit pricing."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Screen Cleaning",
             pricing_type=PricingType.PER_UNIT,
@@ -52,8 +42,6 @@ class TestServiceCreate:
 
     def test_creates_flexible_service(self, db, as_test_user, catalog_service):
         """Creates service with flexible pricing (price set per appointment)."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Custom Job",
             pricing_type=PricingType.FLEXIBLE,
@@ -68,8 +56,6 @@ class TestServiceCreate:
 
     def test_flexible_can_have_optional_default(self, db, as_test_user, catalog_service):
         """Flexible services can have an optional default price as a starting point."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Gutter Cleaning",
             pricing_type=PricingType.FLEXIBLE,
@@ -84,8 +70,6 @@ class TestServiceCreate:
 
     def test_sets_user_id_from_context(self, db, as_test_user, test_user_id, catalog_service):
         """user_id comes from context."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Test Service",
             pricing_type=PricingType.FIXED,
@@ -98,8 +82,6 @@ class TestServiceCreate:
 
     def test_is_active_defaults_true(self, db, as_test_user, catalog_service):
         """New services are active by default."""
-        from core.models import ServiceCreate, PricingType
-
         data = ServiceCreate(
             name="Active Service",
             pricing_type=PricingType.FIXED,
@@ -116,8 +98,6 @@ class TestServiceGetById:
 
     def test_returns_service_when_exists(self, db, as_test_user, catalog_service):
         """Get by ID returns service."""
-        from core.models import ServiceCreate, PricingType
-
         created = catalog_service.create(ServiceCreate(
             name="Test",
             pricing_type=PricingType.FIXED,
@@ -131,7 +111,7 @@ class TestServiceGetById:
 
     def test_returns_none_for_nonexistent(self, db, as_test_user, catalog_service):
         """Missing ID returns None."""
-        result = catalog_service.get_by_id(uuid4())
+        result = catalog_service.get_by_id(MISSING_ID)
         assert result is None
 
 
@@ -140,8 +120,6 @@ class TestServiceListActive:
 
     def test_returns_active_services(self, db, as_test_user, catalog_service):
         """List returns only active services."""
-        from core.models import ServiceCreate, PricingType
-
         catalog_service.create(ServiceCreate(
             name="Active One",
             pricing_type=PricingType.FIXED,
@@ -160,8 +138,6 @@ class TestServiceListActive:
 
     def test_excludes_inactive_services(self, db, as_test_user, catalog_service):
         """Inactive services not returned."""
-        from core.models import ServiceCreate, ServiceUpdate, PricingType
-
         service = catalog_service.create(ServiceCreate(
             name="Will Deactivate",
             pricing_type=PricingType.FIXED,
@@ -180,8 +156,6 @@ class TestServiceUpdate:
 
     def test_updates_price(self, db, as_test_user, catalog_service):
         """Can update default_price_cents."""
-        from core.models import ServiceCreate, ServiceUpdate, PricingType
-
         service = catalog_service.create(ServiceCreate(
             name="Updateable",
             pricing_type=PricingType.FIXED,
@@ -197,8 +171,6 @@ class TestServiceUpdate:
 
     def test_can_deactivate(self, db, as_test_user, catalog_service):
         """Can set is_active=False."""
-        from core.models import ServiceCreate, ServiceUpdate, PricingType
-
         service = catalog_service.create(ServiceCreate(
             name="To Deactivate",
             pricing_type=PricingType.FIXED,
@@ -215,8 +187,6 @@ class TestServiceDelete:
 
     def test_soft_deletes(self, db, db_admin, as_test_user, catalog_service):
         """Services are soft deleted."""
-        from core.models import ServiceCreate, PricingType
-
         service = catalog_service.create(ServiceCreate(
             name="Delete Me",
             pricing_type=PricingType.FIXED,
@@ -235,8 +205,6 @@ class TestServiceDelete:
 
     def test_deleted_not_in_list(self, db, as_test_user, catalog_service):
         """Deleted services not returned by list_active."""
-        from core.models import ServiceCreate, PricingType
-
         service = catalog_service.create(ServiceCreate(
             name="Will Delete",
             pricing_type=PricingType.FIXED,
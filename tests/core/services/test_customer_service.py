@@ -1,17 +1,14 @@
 """Tests for CustomerService."""
 
 import pytest
-from uuid import uuid4
+from uuid import UUID
 
+from core.events import CustomerCreated
+from core.models import CustomerCreate, CustomerUpdate
+from utils.user_context import user_context
 
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService with real DB."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return CustomerService(db, audit, event_bus)
+# Nil UUID: never issued by uuid4(), so it never matches a row
+MISSING_ID = UUID("00000000-0000-0000-0000-000000000000")
 
 
 class TestCustomerCreate:
@@ -19,8 +16,6 @@ class TestCustomerCreate:
 
     def test_creates_customer(self, db, as_test_user, customer_service):
         """Creates customer with provided data."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(
             first_name="Alice",
             last_name="Smith",
@@ -36,8 +31,6 @@ class TestCustomerCreate:
 
     def test_sets_user_id_from_context(self, db, as_test_user, test_user_id, customer_service):
         """user_id comes from context, not parameter."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(first_name="Bob")
         customer = customer_service.create(data)
 
@@ -45,19 +38,16 @@ class TestCustomerCreate:
 
     def test_logs_audit_entry(self, db, as_test_user, customer_service):
         """Create logged to audit_log."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(business_name="Acme Corp")
         customer = customer_service.create(data)
 
         # Check audit log
-        entries = db.execute(
-            "SELECT * FROM audit_log WHERE entity_id = %s",
+        count = db.execute_scalar(
+            """SELECT COUNT(*) FROM audit_log
+               WHERE entity_type = 'customer' AND entity_id = %s AND action = 'create'""",
             (customer.id,)
         )
-        assert len(entries) == 1
-        assert entries[0]["action"] == "create"
-        assert entries[0]["entity_type"] == "customer"
+        assert count == 1
 
 
 class TestCustomerGetById:
@@ -65,8 +55,6 @@ class TestCustomerGetById:
 
     def test_returns_customer_when_exists(self, db, as_test_user, customer_service):
         """Get by ID returns customer."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(first_name="Charlie")
         created = customer_service.create(data)
 
@@ -78,14 +66,11 @@ class TestCustomerGetById:
 
     def test_returns_none_for_nonexistent(self, db, as_test_user, customer_service):
         """Missing ID returns None."""
-        result = customer_service.get_by_id(uuid4())
+        result = customer_service.get_by_id(MISSING_ID)
         assert result is None
 
     def test_rls_blocks_other_users_customer(self, db, as_test_user, as_test_user_b, test_user_id, test_user_b_id, customer_service):
         """User B cannot see User A's customer."""
-        from core.models import CustomerCreate
-        from utils.user_context import user_context
-
         # User A creates customer
         with user_context(test_user_id):
             data = CustomerCreate(first_name="Private")
@@ -103,8 +88,6 @@ class TestCustomerUpdate:
 
     def test_updates_specified_fields(self, db, as_test_user, customer_service):
         """Only provided fields change."""
-        from core.models import CustomerCreate, CustomerUpdate
-
         data = CustomerCreate(first_name="Dave", email="dave@old.com")
         customer = customer_service.create(data)
 
@@ -116,8 +99,6 @@ class TestCustomerUpdate:
 
     def test_logs_field_changes(self, db, as_test_user, customer_service):
         """Audit shows old and new values."""
-        from core.models import CustomerCreate, CustomerUpdate
-
         data = CustomerCreate(first_name="Eve")
         customer = customer_service.create(data)
 
@@ -126,8 +107,8 @@ class TestCustomerUpdate:
 
         # Check audit log for update entry
         entries = db.execute(
-            """SELECT * FROM audit_log
-               WHERE entity_id = %s AND action = 'update'""",
+            """SELECT changes FROM audit_log
+               WHERE entity_type = 'customer' AND entity_id = %s AND action = 'update'""",
             (customer.id,)
         )
         assert len(entries) == 1
@@ -138,12 +119,10 @@ class TestCustomerUpdate:
 
     def test_raises_for_nonexistent(self, db, as_test_user, customer_service):
         """Update on missing customer raises."""
-        from core.models import CustomerUpdate
-
         update = CustomerUpdate(first_name="Ghost")
 
         with pytest.raises(ValueError, match="not found"):
-            customer_service.update(uuid4(), update)
+            customer_service.update(MISSING_ID, update)
 
 
 class TestCustomerDelete:
@@ -151,8 +130,6 @@ class TestCustomerDelete:
 
     def test_soft_deletes(self, db, db_admin, as_test_user, customer_service):
         """Sets deleted_at, doesn't remove row."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(first_name="Frank")
         customer = customer_service.create(data)
 
@@ -168,8 +145,6 @@ class TestCustomerDelete:
 
     def test_deleted_invisible_via_rls(self, db, as_test_user, customer_service):
         """Soft-deleted not returned by get_by_id."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(first_name="Gina")
         customer = customer_service.create(data)
 
@@ -180,53 +155,57 @@ class TestCustomerDelete:
 
     def test_logs_delete_action(self, db, as_test_user, customer_service):
         """Delete logged to audit_log."""
-        from core.models import CustomerCreate
-
         data = CustomerCreate(first_name="Henry")
         customer = customer_service.create(data)
 
         customer_service.delete(customer.id)
 
-        entries = db.execute(
-            """SELECT * FROM audit_log
-               WHERE entity_id = %s AND action = 'delete'""",
+        count = db.execute_scalar(
+            """SELECT COUNT(*) FROM audit_log
+               WHERE entity_type = 'customer' AND entity_id = %s AND action = 'delete'""",
             (customer.id,)
         )
-        assert len(entries) == 1
+        assert count == 1
+
+
+# Function-scoped on purpose: reset_db_state wipes customers before every test
+@pytest.fixture
+def seeded_customers(as_test_user, seed_customers):
+    """Five customers (returned as ids) shared by the read-only list and search tests.
+
+    Read-only scaffolding, so rows go in with one multi-row INSERT (no audit
+    entries).
+    """
+    customers = seed_customers([
+        CustomerCreate(first_name=first_name, email=email)
+        for first_name, email in [
+            ("Ivan", None),
+            ("Katherine", None),
+            ("Kevin", None),
+            ("Larry", "larry@unique-domain.com"),
+            ("Michelle", None),
+        ]
+    ])
+    return [customer.id for customer in customers]
 
 
 class TestCustomerList:
     """Tests for CustomerService.list."""
 
-    def test_returns_customers(self, db, as_test_user, customer_service):
+    def test_returns_customers(self, db, as_test_user, customer_service, seeded_customers):
         """List returns created customers."""
-        from core.models import CustomerCreate
-
-        customer_service.create(CustomerCreate(first_name="Ivan"))
-        customer_service.create(CustomerCreate(first_name="Jane"))
-
         result = customer_service.list_all()
 
-        assert len(result) >= 2
+        assert {c.first_name for c in result} == {"Ivan", "Katherine", "Kevin", "Larry", "Michelle"}
 
-    def test_respects_limit(self, db, as_test_user, customer_service):
+    def test_respects_limit(self, db, as_test_user, customer_service, seeded_customers):
         """List respects limit parameter."""
-        from core.models import CustomerCreate
-
-        for i in range(5):
-            customer_service.create(CustomerCreate(first_name=f"User{i}"))
-
         result = customer_service.list_all(limit=3)
 
         assert len(result) == 3
 
-    def test_offset_pagination(self, db, as_test_user, customer_service):
+    def test_offset_pagination(self, db, as_test_user, customer_service, seeded_customers):
         """Offset skips records."""
-        from core.models import CustomerCreate
-
-        for i in range(5):
-            customer_service.create(CustomerCreate(first_name=f"User{i}"))
-
         page1 = customer_service.list_all(limit=2, offset=0)
         page2 = customer_service.list_all(limit=2, offset=2)
 
@@ -239,38 +218,21 @@ class TestCustomerList:
 class TestCustomerSearch:
     """Tests for CustomerService.search."""
 
-    def test_finds_by_first_name(self, db, as_test_user, customer_service):
+    def test_finds_by_first_name(self, db, as_test_user, customer_service, seeded_customers):
         """Search matches first_name."""
-        from core.models import CustomerCreate
-
-        customer_service.create(CustomerCreate(first_name="Katherine"))
-        customer_service.create(CustomerCreate(first_name="Kevin"))
-
         results = customer_service.search("Kath")
 
-        assert len(results) >= 1
-        assert any(c.first_name == "Katherine" for c in results)
+        assert [c.first_name for c in results] == ["Katherine"]
 
-    def test_finds_by_email(self, db, as_test_user, customer_service):
+    def test_finds_by_email(self, db, as_test_user, customer_service, seeded_customers):
         """Search matches email."""
-        from core.models import CustomerCreate
-
-        customer_service.create(CustomerCreate(
-            first_name="Larry",
-            email="larry@unique-domain.com"
-        ))
-
         results = customer_service.search("unique-domain")
 
         assert len(results) >= 1
         assert any(c.email == "larry@unique-domain.com" for c in results)
 
-    def test_case_insensitive(self, db, as_test_user, customer_service):
+    def test_case_insensitive(self, db, as_test_user, customer_service, seeded_customers):
         """Search is case-insensitive."""
-        from core.models import CustomerCreate
-
-        customer_service.create(CustomerCreate(first_name="Michelle"))
-
         results = customer_service.search("michelle")
 
         assert len(results) >= 1
@@ -280,9 +242,6 @@ class TestCustomerEventPublishing:
     """Verify that CustomerService publishes domain events to the bus."""
 
     def test_create_publishes_customer_created(self, db, as_test_user, customer_service, event_bus):
-        from core.models import CustomerCreate
-        from core.events import CustomerCreated
-
         received = []
         event_bus.subscribe("CustomerCreated", received.append)
 
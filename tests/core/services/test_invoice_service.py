@@ -1,82 +1,30 @@
 """Tests for InvoiceService."""
 
 import pytest
-from uuid import uuid4
+from uuid import UUID
 from datetime import timedelta
 
+from core.events import InvoiceSent, InvoicePaid
+from core.models import (
+    CustomerCreate, AddressCreate, ServiceCreate, PricingType,
+    Ticket, TicketCreate, InvoiceStatus,
+)
 from utils.timezone import now_utc
+from utils.user_context import get_current_user_id
 
-
-@pytest.fixture
-def invoice_service(db, event_bus):
-    """InvoiceService with real DB."""
-    from core.services.invoice_service import InvoiceService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return InvoiceService(db, audit, event_bus)
-
-
-@pytest.fixture
-def ticket_service(db, event_bus):
-    """TicketService for test setup."""
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-
-    return TicketService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def line_item_service(db):
-    """LineItemService for test setup."""
-    from core.services.line_item_service import LineItemService
-    from core.audit import AuditLogger
-
-    return LineItemService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService for test setup."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
-
-    return CustomerService(db, AuditLogger(db), event_bus)
-
-
-@pytest.fixture
-def address_service(db):
-    """AddressService for test setup."""
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
-
-    return AddressService(db, AuditLogger(db))
-
-
-@pytest.fixture
-def catalog_service(db):
-    """CatalogService for test setup."""
-    from core.services.catalog_service import CatalogService
-    from core.audit import AuditLogger
-
-    return CatalogService(db, AuditLogger(db))
+# Nil UUID: never issued by uuid4(), so it never matches a row
+MISSING_ID = UUID("00000000-0000-0000-0000-000000000000")
 
 
 @pytest.fixture
 def test_customer(as_test_user, customer_service):
     """Create a test customer."""
-    from core.models import CustomerCreate
-
-    customer = customer_service.create(CustomerCreate(first_name="Invoice", last_name="Test"))
-    yield customer
-    customer_service.delete(customer.id)
+    return customer_service.create(CustomerCreate(first_name="Invoice", last_name="Test"))
 
 
 @pytest.fixture
 def test_address(as_test_user, address_service, test_customer):
     """Create a test address."""
-    from core.models import AddressCreate
-
     return address_service.create(AddressCreate(
         customer_id=test_customer.id,
         street="123 Invoice Lane",
@@ -89,43 +37,45 @@ def test_address(as_test_user, address_service, test_customer):
 @pytest.fixture
 def test_service(as_test_user, catalog_service):
     """Create a test service in the catalog."""
-    from core.models import ServiceCreate, PricingType
-
-    service = catalog_service.create(ServiceCreate(
+    return catalog_service.create(ServiceCreate(
         name="Invoice Test Service",
         pricing_type=PricingType.FIXED,
         default_price_cents=10000  # $100.00
     ))
-    yield service
-    catalog_service.delete(service.id)
 
 
 @pytest.fixture
-def test_ticket_with_items(as_test_user, ticket_service, line_item_service, test_customer, test_address, test_service):
-    """Create a test ticket with line items."""
-    from core.models import TicketCreate, LineItemCreate
-
-    ticket = ticket_service.create(TicketCreate(
-        customer_id=test_customer.id,
-        address_id=test_address.id,
-        scheduled_at=now_utc() + timedelta(days=1)
-    ))
-
-    # Add some line items
-    line_item_service.create(ticket.id, LineItemCreate(
-        service_id=test_service.id,
-        quantity=2,
-        unit_price_cents=10000,
-        total_price_cents=20000  # $200
-    ))
-    line_item_service.create(ticket.id, LineItemCreate(
-        service_id=test_service.id,
-        quantity=1,
-        total_price_cents=5000  # $50
-    ))
-
-    yield ticket
-    ticket_service.delete(ticket.id)
+def test_ticket_with_items(db, as_test_user, test_customer, test_address, test_service):
+    """Create a test ticket with $250 of line items in one statement.
+
+    Ticket and line item services are covered by their own tests; here they
+    are scaffolding, so insert the rows directly (no audit entries).
+    """
+    row = db.execute_returning(
+        """
+        WITH ticket AS (
+            INSERT INTO tickets (id, user_id, customer_id, address_id, scheduled_at)
+            VALUES (gen_random_uuid(), %(user_id)s, %(customer_id)s, %(address_id)s, %(scheduled_at)s)
+            RETURNING *
+        ), items AS (
+            INSERT INTO line_items (user_id, ticket_id, service_id, quantity, unit_price_cents, total_price_cents)
+            SELECT %(user_id)s, ticket.id, %(service_id)s, item.quantity, item.unit_price_cents, item.total_price_cents
+            FROM ticket, (VALUES
+                (2, 10000, 20000),  -- $200
+                (1, NULL, 5000)     -- $50
+            ) AS item(quantity, unit_price_cents, total_price_cents)
+        )
+        SELECT * FROM ticket
+        """,
+        {
+            "user_id": get_current_user_id(),
+            "customer_id": test_customer.id,
+            "address_id": test_address.id,
+            "service_id": test_service.id,
+            "scheduled_at": now_utc() + timedelta(days=1),
+        }
+    )[0]
+    return Ticket.model_validate(row)
 
 
 class TestInvoiceCreate:
@@ -133,8 +83,6 @@ class TestInvoiceCreate:
 
     def test_creates_invoice_from_ticket(self, db, as_test_user, invoice_service, test_ticket_with_items, test_customer):
         """Creates invoice from ticket line items."""
-        from core.models import InvoiceStatus
-
         invoice = invoice_service.create_from_ticket(
             test_ticket_with_items.id,
             tax_rate_bps=825  # 8.25% sales tax
@@ -151,8 +99,6 @@ class TestInvoiceCreate:
 
     def test_invoice_starts_as_draft(self, db, as_test_user, invoice_service, test_ticket_with_items):
         """New invoices start in DRAFT status."""
-        from core.models import InvoiceStatus
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
 
         assert invoice.status == InvoiceStatus.DRAFT
@@ -169,8 +115,6 @@ class TestInvoiceCreate:
 
     def test_rejects_ticket_without_items(self, db, as_test_user, invoice_service, ticket_service, test_customer, test_address):
         """Cannot create invoice from ticket with no line items."""
-        from core.models import TicketCreate
-
         empty_ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -180,8 +124,6 @@ class TestInvoiceCreate:
         with pytest.raises(ValueError, match="no line items"):
             invoice_service.create_from_ticket(empty_ticket.id)
 
-        ticket_service.delete(empty_ticket.id)
-
 
 class TestInvoiceGet:
     """Tests for InvoiceService.get_by_id."""
@@ -197,7 +139,7 @@ class TestInvoiceGet:
 
     def test_returns_none_for_missing(self, db, as_test_user, invoice_service):
         """Returns None for non-existent invoice."""
-        result = invoice_service.get_by_id(uuid4())
+        result = invoice_service.get_by_id(MISSING_ID)
         assert result is None
 
 
@@ -206,8 +148,6 @@ class TestInvoiceSend:
 
     def test_send_marks_sent(self, db, as_test_user, invoice_service, test_ticket_with_items):
         """Sending invoice updates status and timestamps."""
-        from core.models import InvoiceStatus
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
 
         sent = invoice_service.send(invoice.id)
@@ -225,53 +165,31 @@ class TestInvoiceSend:
             invoice_service.send(invoice.id)
 
 
-class TestInvoicePayment:
-    """Tests for InvoiceService payment methods."""
-
-    def test_record_payment_partial(self, db, as_test_user, invoice_service, test_ticket_with_items):
-        """Recording partial payment updates status to PARTIAL."""
-        from core.models import InvoiceStatus
-
-        invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
-        invoice_service.send(invoice.id)
-
-        # Pay half
-        partial_amount = invoice.total_amount_cents // 2
-        updated = invoice_service.record_payment(invoice.id, partial_amount)
-
-        assert updated.amount_paid_cents == partial_amount
-        assert updated.status == InvoiceStatus.PARTIAL
-
-    def test_record_payment_full(self, db, as_test_user, invoice_service, test_ticket_with_items):
-        """Recording full payment marks as PAID."""
-        from core.models import InvoiceStatus
-
-        invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
-        invoice_service.send(invoice.id)
-
-        updated = invoice_service.record_payment(invoice.id, invoice.total_amount_cents)
-
-        assert updated.status == InvoiceStatus.PAID
-        assert updated.paid_at is not None
-        assert updated.amount_paid_cents == invoice.total_amount_cents
+@pytest.fixture
+def sent_invoice(as_test_user, invoice_service, test_ticket_with_items):
+    """A $250 invoice from test_ticket_with_items, already sent."""
+    invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
+    return invoice_service.send(invoice.id)
 
-    def test_multiple_payments(self, db, as_test_user, invoice_service, test_ticket_with_items):
-        """Multiple payments accumulate."""
-        from core.models import InvoiceStatus
 
-        invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
-        invoice_service.send(invoice.id)
+class TestInvoicePayment:
+    """Tests for InvoiceService payment methods."""
 
-        # First payment
-        first_payment = 10000
-        invoice_service.record_payment(invoice.id, first_payment)
+    @pytest.mark.parametrize("payment_pcts, expected_status", [
+        pytest.param([50], InvoiceStatus.PARTIAL, id="partial"),
+        pytest.param([100], InvoiceStatus.PAID, id="full"),
+        pytest.param([40, 60], InvoiceStatus.PAID, id="multiple-accumulate"),
+    ])
+    def test_record_payment(self, db, as_test_user, invoice_service, sent_invoice, payment_pcts, expected_status):
+        """Payments accumulate; status follows the amount paid against the total."""
+        total = sent_invoice.total_amount_cents
 
-        # Second payment - pay the rest
-        remaining = invoice.total_amount_cents - first_payment
-        updated = invoice_service.record_payment(invoice.id, remaining)
+        for pct in payment_pcts:
+            updated = invoice_service.record_payment(sent_invoice.id, total * pct // 100)
 
-        assert updated.amount_paid_cents == invoice.total_amount_cents
-        assert updated.status == InvoiceStatus.PAID
+        assert updated.amount_paid_cents == total * sum(payment_pcts) // 100
+        assert updated.status == expected_status
+        assert (updated.paid_at is not None) == (expected_status == InvoiceStatus.PAID)
 
 
 class TestInvoiceVoid:
@@ -279,8 +197,6 @@ class TestInvoiceVoid:
 
     def test_void_invoice(self, db, as_test_user, invoice_service, test_ticket_with_items):
         """Voiding invoice sets status and timestamp."""
-        from core.models import InvoiceStatus
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
 
         voided = invoice_service.void(invoice.id)
@@ -315,9 +231,6 @@ class TestInvoiceEventPublishing:
     """Verify that InvoiceService publishes domain events to the bus."""
 
     def test_send_publishes_invoice_sent(self, db, as_test_user, invoice_service, event_bus, test_ticket_with_items):
-        from core.models import InvoiceStatus
-        from core.events import InvoiceSent
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
 
         received = []
@@ -331,9 +244,6 @@ class TestInvoiceEventPublishing:
         assert received[0].invoice.status == InvoiceStatus.SENT
 
     def test_full_payment_publishes_invoice_paid(self, db, as_test_user, invoice_service, event_bus, test_ticket_with_items):
-        from core.models import InvoiceStatus
-        from core.events import InvoicePaid
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
         invoice_service.send(invoice.id)
 
@@ -348,8 +258,6 @@ class TestInvoiceEventPublishing:
         assert received[0].invoice.status == InvoiceStatus.PAID
 
     def test_partial_payment_does_not_publish_invoice_paid(self, db, as_test_user, invoice_service, event_bus, test_ticket_with_items):
-        from core.events import InvoicePaid
-
         invoice = invoice_service.create_from_ticket(test_ticket_with_items.id)
         invoice_service.send(invoice.id)
 
@@ -1,99 +1,66 @@
 """Tests for MessageService."""
 
 import pytest
-from uuid import uuid4
 from datetime import timedelta
-from unittest.mock import Mock, patch
 
+from core.models import ScheduledMessageCreate, MessageType, MessageStatus, CustomerCreate
+from core.services.message_service import MessageService
 from utils.timezone import now_utc
 
 
 @pytest.fixture
-def message_service(db):
+def message_service(db, audit_logger):
     """MessageService with real DB."""
-    from core.services.message_service import MessageService
-    from core.audit import AuditLogger
+    return MessageService(db, audit_logger)
 
-    audit = AuditLogger(db)
-    return MessageService(db, audit)
 
+class FakeEmailClient:
+    """Email gateway stand-in: records send() calls, raises for addresses in fail_for."""
 
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService for test setup."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
+    def __init__(self):
+        self.calls: list[dict] = []
+        self.fail_for: set[str] = set()
 
-    return CustomerService(db, AuditLogger(db), event_bus)
+    def send(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs["to"] in self.fail_for:
+            raise Exception("Gateway unavailable")
+        return True
 
 
 @pytest.fixture
-def ticket_service(db, event_bus):
-    """TicketService for test setup."""
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-
-    return TicketService(db, AuditLogger(db), event_bus)
+def email_client():
+    """Fresh FakeEmailClient per test."""
+    return FakeEmailClient()
 
 
 @pytest.fixture
-def address_service(db):
-    """AddressService for test setup."""
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
+def test_customer(as_test_user, seed_customer):
+    """Customer the messages are addressed to.
 
-    return AddressService(db, AuditLogger(db))
+    Scaffolding only, so it and the address/ticket below are seeded with
+    raw INSERTs rather than through their services.
+    """
+    return seed_customer(first_name="Message", last_name="Test")
 
 
 @pytest.fixture
-def test_customer(as_test_user, customer_service):
-    """Create a test customer."""
-    from core.models import CustomerCreate
-
-    customer = customer_service.create(CustomerCreate(
-        first_name="Message",
-        last_name="Test",
-        email="message@example.com"
-    ))
-    yield customer
-    customer_service.delete(customer.id)
+def test_address(as_test_user, seed_address, test_customer):
+    """Address for test_customer."""
+    return seed_address(test_customer.id, street="999 Message Blvd")
 
 
 @pytest.fixture
-def test_address(as_test_user, address_service, test_customer):
-    """Create a test address."""
-    from core.models import AddressCreate
-
-    return address_service.create(AddressCreate(
-        customer_id=test_customer.id,
-        street="999 Message Blvd",
-        city="Austin",
-        state="TX",
-        zip="78705"
-    ))
-
-
-@pytest.fixture
-def test_ticket(as_test_user, ticket_service, test_customer, test_address):
-    """Create a test ticket."""
-    from core.models import TicketCreate
-
-    ticket = ticket_service.create(TicketCreate(
-        customer_id=test_customer.id,
-        address_id=test_address.id,
-        scheduled_at=now_utc() + timedelta(days=7)
-    ))
-    yield ticket
-    ticket_service.delete(ticket.id)
+def test_ticket(as_test_user, seed_ticket, test_customer, test_address):
+    """Ticket for test_customer at test_address."""
+    return seed_ticket(test_customer.id, test_address.id)
 
 
 class TestMessageSchedule:
     """Tests for MessageService.schedule."""
 
-    def test_schedules_message_with_all_fields(self, db, as_test_user, message_service, test_customer):
+    def test_schedules_message_with_all_fields(self, as_test_user, message_service, test_customer):
         """Schedules a message and verifies all fields are persisted correctly."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         scheduled_for = now_utc() + timedelta(days=1)
         data = ScheduledMessageCreate(
             customer_id=test_customer.id,
@@ -116,10 +83,8 @@ class TestMessageSchedule:
         assert message.scheduled_for == scheduled_for
         assert message.created_at is not None
 
-    def test_schedules_ticket_linked_message(self, db, as_test_user, message_service, test_customer, test_ticket):
+    def test_schedules_ticket_linked_message(self, as_test_user, message_service, test_customer, test_ticket):
         """Schedules message linked to ticket for appointment tracking."""
-        from core.models import ScheduledMessageCreate, MessageType
-
         data = ScheduledMessageCreate(
             customer_id=test_customer.id,
             ticket_id=test_ticket.id,
@@ -138,10 +103,8 @@ class TestMessageSchedule:
 class TestMessageStatusTransitions:
     """Tests for message status lifecycle transitions."""
 
-    def test_pending_to_sent_transition(self, db, as_test_user, message_service, test_customer):
+    def test_pending_to_sent_transition(self, as_test_user, message_service, test_customer):
         """Verifies pending -> sent transition updates status correctly."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -158,10 +121,8 @@ class TestMessageStatusTransitions:
         refetched = message_service.get_by_id(message.id)
         assert refetched.status == MessageStatus.SENT
 
-    def test_pending_to_failed_transition(self, db, as_test_user, message_service, test_customer):
+    def test_pending_to_failed_transition(self, as_test_user, message_service, test_customer):
         """Verifies pending -> failed transition when gateway error occurs."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -175,10 +136,8 @@ class TestMessageStatusTransitions:
         refetched = message_service.get_by_id(message.id)
         assert refetched.status == MessageStatus.FAILED
 
-    def test_pending_to_skipped_transition(self, db, as_test_user, message_service, test_customer):
+    def test_pending_to_skipped_transition(self, as_test_user, message_service, test_customer):
         """Verifies pending -> skipped when message cannot be delivered (no email, etc.)."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -192,10 +151,8 @@ class TestMessageStatusTransitions:
         refetched = message_service.get_by_id(message.id)
         assert refetched.status == MessageStatus.SKIPPED
 
-    def test_pending_to_cancelled_transition(self, db, as_test_user, message_service, test_customer):
+    def test_pending_to_cancelled_transition(self, as_test_user, message_service, test_customer):
         """Verifies pending -> cancelled transition."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -207,10 +164,8 @@ class TestMessageStatusTransitions:
 
         assert cancelled.status == MessageStatus.CANCELLED
 
-    def test_cannot_cancel_sent_message(self, db, as_test_user, message_service, test_customer):
+    def test_cannot_cancel_sent_message(self, as_test_user, message_service, test_customer):
         """Cannot transition from sent back to cancelled."""
-        from core.models import ScheduledMessageCreate, MessageType
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -222,10 +177,23 @@ class TestMessageStatusTransitions:
         with pytest.raises(ValueError, match="not pending"):
             message_service.cancel(message.id)
 
-    def test_cannot_cancel_failed_message(self, db, as_test_user, message_service, test_customer):
-        """Cannot transition from failed to cancelled."""
-        from core.models import ScheduledMessageCreate, MessageType
+    def test_cannot_mark_cancelled_message_sent(self, as_test_user, message_service, test_customer):
+        """Status transitions only start from pending."""
+        message = message_service.schedule(ScheduledMessageCreate(
+            customer_id=test_customer.id,
+            message_type=MessageType.CUSTOM,
+            body="Cancelled first",
+            scheduled_for=now_utc()
+        ))
+        message_service.cancel(message.id)
+
+        with pytest.raises(ValueError, match="not pending"):
+            message_service.mark_sent(message.id)
 
+        assert message_service.get_by_id(message.id).status == MessageStatus.CANCELLED
+
+    def test_cannot_cancel_failed_message(self, as_test_user, message_service, test_customer):
+        """Cannot transition from failed to cancelled."""
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -241,33 +209,31 @@ class TestMessageStatusTransitions:
 class TestPendingMessageRetrieval:
     """Tests for retrieving messages ready to be sent."""
 
-    def test_list_pending_due_returns_only_due_messages(self, db, as_test_user, message_service, test_customer):
+    def test_list_pending_due_returns_only_due_messages(self, as_test_user, message_service, test_customer, seed_messages):
         """list_pending_due returns messages where scheduled_for <= now."""
-        from core.models import ScheduledMessageCreate, MessageType
-
-        # Message due 5 minutes ago
-        past_msg = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Due in past",
-            scheduled_for=now_utc() - timedelta(minutes=5)
-        ))
-
-        # Message due right now
-        now_msg = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Due now",
-            scheduled_for=now_utc()
-        ))
-
-        # Message due tomorrow - should NOT be returned
-        future_msg = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Due tomorrow",
-            scheduled_for=now_utc() + timedelta(days=1)
-        ))
+        past_msg, now_msg, future_msg = seed_messages([
+            # Message due 5 minutes ago
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body="Due in past",
+                scheduled_for=now_utc() - timedelta(minutes=5)
+            ),
+            # Message due right now
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body="Due now",
+                scheduled_for=now_utc()
+            ),
+            # Message due tomorrow - should NOT be returned
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body="Due tomorrow",
+                scheduled_for=now_utc() + timedelta(days=1)
+            ),
+        ])
 
         pending = message_service.list_pending_due()
         pending_ids = {m.id for m in pending}
@@ -276,10 +242,8 @@ class TestPendingMessageRetrieval:
         assert now_msg.id in pending_ids
         assert future_msg.id not in pending_ids
 
-    def test_list_pending_due_excludes_non_pending_statuses(self, db, as_test_user, message_service, test_customer):
+    def test_list_pending_due_excludes_non_pending_statuses(self, as_test_user, message_service, test_customer):
         """Only pending messages are returned, not sent/failed/skipped/cancelled."""
-        from core.models import ScheduledMessageCreate, MessageType
-
         base_time = now_utc() - timedelta(minutes=5)
 
         sent = message_service.schedule(ScheduledMessageCreate(
@@ -326,10 +290,8 @@ class TestPendingMessageRetrieval:
 class TestProcessPendingMessages:
     """Tests for the process_pending method that sends messages."""
 
-    def test_process_pending_sends_due_messages(self, db, as_test_user, message_service, test_customer):
+    def test_process_pending_sends_due_messages(self, as_test_user, message_service, test_customer, email_client):
         """process_pending sends all due messages through email gateway."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         # Create due message
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
@@ -339,22 +301,17 @@ class TestProcessPendingMessages:
             scheduled_for=now_utc() - timedelta(minutes=1)
         ))
 
-        # Mock the email client
-        mock_email_client = Mock()
-        mock_email_client.send.return_value = True
-
-        # Process with mocked email client
         results = message_service.process_pending(
-            email_client=mock_email_client,
+            email_client=email_client,
             customer_email_lookup=lambda cid: "message@example.com"
         )
 
         # Verify email client was called with correct params
-        mock_email_client.send.assert_called_once()
-        call_args = mock_email_client.send.call_args
-        assert call_args.kwargs["to"] == "message@example.com"
-        assert call_args.kwargs["subject"] == "Test Subject"
-        assert call_args.kwargs["body"] == "Test body content"
+        assert email_client.calls == [{
+            "to": "message@example.com",
+            "subject": "Test Subject",
+            "body": "Test body content",
+        }]
 
         # Verify message is now sent
         updated = message_service.get_by_id(message.id)
@@ -365,10 +322,8 @@ class TestProcessPendingMessages:
         assert results["failed"] == 0
         assert results["skipped"] == 0
 
-    def test_process_pending_marks_failed_on_gateway_error(self, db, as_test_user, message_service, test_customer):
+    def test_process_pending_marks_failed_on_gateway_error(self, as_test_user, message_service, test_customer, email_client):
         """process_pending marks message as FAILED when gateway throws exception."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         message = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
@@ -377,12 +332,11 @@ class TestProcessPendingMessages:
             scheduled_for=now_utc() - timedelta(minutes=1)
         ))
 
-        # Mock email client that fails
-        mock_email_client = Mock()
-        mock_email_client.send.side_effect = Exception("Gateway unavailable")
+        # Gateway fails for this customer's address
+        email_client.fail_for.add("message@example.com")
 
         results = message_service.process_pending(
-            email_client=mock_email_client,
+            email_client=email_client,
             customer_email_lookup=lambda cid: "message@example.com"
         )
 
@@ -395,10 +349,8 @@ class TestProcessPendingMessages:
         assert results["failed"] == 1
         assert results["skipped"] == 0
 
-    def test_process_pending_marks_skipped_when_no_email(self, db, as_test_user, message_service, customer_service):
+    def test_process_pending_marks_skipped_when_no_email(self, as_test_user, message_service, customer_service, email_client):
         """process_pending marks SKIPPED (not failed) when customer has no email."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus, CustomerCreate
-
         # Create customer without email
         customer_no_email = customer_service.create(CustomerCreate(
             first_name="No",
@@ -412,15 +364,13 @@ class TestProcessPendingMessages:
             scheduled_for=now_utc() - timedelta(minutes=1)
         ))
 
-        mock_email_client = Mock()
-
         results = message_service.process_pending(
-            email_client=mock_email_client,
+            email_client=email_client,
             customer_email_lookup=lambda cid: None  # Simulates no email
         )
 
         # Email client should NOT be called - we know before trying that we can't send
-        mock_email_client.send.assert_not_called()
+        assert email_client.calls == []
 
         # Message should be SKIPPED (precondition failed), not FAILED (gateway error)
         updated = message_service.get_by_id(message.id)
@@ -431,12 +381,8 @@ class TestProcessPendingMessages:
         assert results["failed"] == 0
         assert results["skipped"] == 1
 
-        customer_service.delete(customer_no_email.id)
-
-    def test_process_pending_mixed_results(self, db, as_test_user, message_service, customer_service):
+    def test_process_pending_mixed_results(self, as_test_user, message_service, customer_service, email_client, seed_messages):
         """process_pending correctly categorizes sent/failed/skipped."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus, CustomerCreate
-
         # Customer with email - will succeed
         good_customer = customer_service.create(CustomerCreate(
             first_name="Good",
@@ -457,34 +403,22 @@ class TestProcessPendingMessages:
             email="fail@example.com"
         ))
 
-        msg_success = message_service.schedule(ScheduledMessageCreate(
-            customer_id=good_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Will succeed",
-            scheduled_for=now_utc() - timedelta(minutes=1)
-        ))
+        msg_success, msg_skip, msg_fail = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() - timedelta(minutes=1)
+            )
+            for customer, body in [
+                (good_customer, "Will succeed"),
+                (no_email_customer, "Will skip"),
+                (fail_customer, "Will fail"),
+            ]
+        ])
 
-        msg_skip = message_service.schedule(ScheduledMessageCreate(
-            customer_id=no_email_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Will skip",
-            scheduled_for=now_utc() - timedelta(minutes=1)
-        ))
-
-        msg_fail = message_service.schedule(ScheduledMessageCreate(
-            customer_id=fail_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Will fail",
-            scheduled_for=now_utc() - timedelta(minutes=1)
-        ))
-
-        # Mock email client: succeed for good, fail for fail
-        mock_email_client = Mock()
-        def send_side_effect(**kwargs):
-            if kwargs["to"] == "fail@example.com":
-                raise Exception("Gateway error")
-            return True
-        mock_email_client.send.side_effect = send_side_effect
+        # Gateway succeeds for good, fails for fail
+        email_client.fail_for.add("fail@example.com")
 
         def email_lookup(cid):
             if cid == good_customer.id:
@@ -494,7 +428,7 @@ class TestProcessPendingMessages:
             return None
 
         results = message_service.process_pending(
-            email_client=mock_email_client,
+            email_client=email_client,
             customer_email_lookup=email_lookup
         )
 
@@ -508,19 +442,113 @@ class TestProcessPendingMessages:
         assert results["skipped"] == 1
         assert results["failed"] == 1
 
-        # Cleanup
-        customer_service.delete(good_customer.id)
-        customer_service.delete(no_email_customer.id)
-        customer_service.delete(fail_customer.id)
+    def test_process_pending_audits_each_status_change(self, db, as_test_user, message_service, test_customer, email_client, seed_messages):
+        """Each status change leaves one audit entry per message."""
+        messages = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() - timedelta(minutes=1)
+            )
+            for body in ("One", "Two")
+        ])
+
+        message_service.process_pending(
+            email_client=email_client,
+            customer_email_lookup=lambda cid: None
+        )
+
+        entries = db.execute(
+            "SELECT entity_id, changes FROM audit_log "
+            "WHERE entity_type = 'scheduled_message' AND entity_id = ANY(%s) AND action = 'update'",
+            ([m.id for m in messages],)
+        )
+        assert {e["entity_id"] for e in entries} == {m.id for m in messages}
+        assert all(e["changes"]["skip_reason"] == "Customer has no email" for e in entries)
+
+    def test_process_pending_records_sends_before_a_later_failure(self, as_test_user, message_service, test_customer, email_client, seed_messages):
+        """A message already sent stays recorded as sent if a later lookup raises."""
+        first, second = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() - timedelta(minutes=minutes)
+            )
+            for body, minutes in (("First", 2), ("Second", 1))
+        ])
+        lookups = iter(["first@example.com"])
+
+        def email_lookup(cid):
+            return next(lookups)
+
+        with pytest.raises(StopIteration):
+            message_service.process_pending(
+                email_client=email_client,
+                customer_email_lookup=email_lookup
+            )
+
+        assert message_service.get_by_id(first.id).status == MessageStatus.SENT
+        assert message_service.get_by_id(second.id).status == MessageStatus.PENDING
+
+    def test_process_pending_leaves_cancelled_messages_cancelled(self, as_test_user, message_service, test_customer, email_client, seed_messages):
+        """A message cancelled mid-run is not overwritten with its send outcome."""
+        first, second = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() - timedelta(minutes=minutes)
+            )
+            for body, minutes in (("First", 2), ("Second", 1))
+        ])
+
+        def email_lookup(cid):
+            if message_service.get_by_id(second.id).status == MessageStatus.PENDING:
+                message_service.cancel(second.id)
+            return "customer@example.com"
+
+        results = message_service.process_pending(
+            email_client=email_client,
+            customer_email_lookup=email_lookup
+        )
+
+        assert message_service.get_by_id(first.id).status == MessageStatus.SENT
+        assert message_service.get_by_id(second.id).status == MessageStatus.CANCELLED
+        # Only the transition actually recorded is counted
+        assert results["sent"] == 1
+
+    def test_process_pending_defaults_to_stored_customer_emails(self, as_test_user, message_service, customer_service, email_client, seed_messages):
+        """Without a lookup, each customer's stored email is used (or the message skipped)."""
+        with_email = customer_service.create(CustomerCreate(first_name="Stored", email="stored@example.com"))
+        without_email = customer_service.create(CustomerCreate(first_name="Nothing"))
+
+        seed_messages([
+            ScheduledMessageCreate(
+                customer_id=customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() - timedelta(minutes=1)
+            )
+            for customer, body in [
+                (with_email, "First"),
+                (with_email, "Second"),
+                (without_email, "Skipped"),
+            ]
+        ])
+
+        results = message_service.process_pending(email_client=email_client)
+
+        assert [call["to"] for call in email_client.calls] == ["stored@example.com"] * 2
+        assert results == {"sent": 2, "failed": 0, "skipped": 1}
 
 
 class TestListPendingForTicket:
     """Tests for MessageService.list_pending_for_ticket."""
 
-    def test_returns_pending_messages_for_ticket(self, db, as_test_user, message_service, test_customer, test_ticket):
+    def test_returns_pending_messages_for_ticket(self, as_test_user, message_service, test_customer, test_ticket):
         """Returns only pending messages linked to the specified ticket."""
-        from core.models import ScheduledMessageCreate, MessageType, MessageStatus
-
         msg = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             ticket_id=test_ticket.id,
@@ -536,10 +564,8 @@ class TestListPendingForTicket:
         assert pending[0].ticket_id == test_ticket.id
         assert pending[0].status == MessageStatus.PENDING
 
-    def test_excludes_non_pending_messages(self, db, as_test_user, message_service, test_customer, test_ticket):
+    def test_excludes_non_pending_messages(self, as_test_user, message_service, test_customer, test_ticket):
         """Sent, cancelled, and failed messages are excluded."""
-        from core.models import ScheduledMessageCreate, MessageType
-
         sent_msg = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             ticket_id=test_ticket.id,
@@ -564,15 +590,9 @@ class TestListPendingForTicket:
         assert sent_msg.id not in pending_ids
         assert cancelled_msg.id not in pending_ids
 
-    def test_excludes_messages_for_other_tickets(self, db, as_test_user, message_service, test_customer, test_ticket, ticket_service, test_address):
+    def test_excludes_messages_for_other_tickets(self, as_test_user, message_service, test_customer, test_ticket, seed_ticket, test_address):
         """Messages linked to a different ticket are not returned."""
-        from core.models import ScheduledMessageCreate, MessageType, TicketCreate
-
-        other_ticket = ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=14)
-        ))
+        other_ticket = seed_ticket(test_customer.id, test_address.id)
 
         message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
@@ -586,15 +606,13 @@ class TestListPendingForTicket:
 
         assert pending == []
 
-    def test_returns_empty_for_ticket_with_no_messages(self, db, as_test_user, message_service, test_ticket):
+    def test_returns_empty_for_ticket_with_no_messages(self, as_test_user, message_service, test_ticket):
         """Returns empty list when ticket has no pending messages."""
         pending = message_service.list_pending_for_ticket(test_ticket.id)
         assert pending == []
 
-    def test_ordered_by_scheduled_for_ascending(self, db, as_test_user, message_service, test_customer, test_ticket):
+    def test_ordered_by_scheduled_for_ascending(self, as_test_user, message_service, test_customer, test_ticket):
         """Pending messages are ordered by scheduled_for ASC (earliest first)."""
-        from core.models import ScheduledMessageCreate, MessageType
-
         later = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             ticket_id=test_ticket.id,
@@ -621,31 +639,18 @@ class TestListPendingForTicket:
 class TestMessageList:
     """Tests for listing messages."""
 
-    def test_list_for_customer_returns_all_statuses(self, db, as_test_user, message_service, test_customer):
+    def test_list_for_customer_returns_all_statuses(self, as_test_user, message_service, test_customer, seed_messages):
         """list_for_customer returns messages regardless of status."""
-        from core.models import ScheduledMessageCreate, MessageType
-
-        pending = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Pending",
-            scheduled_for=now_utc() + timedelta(days=1)
-        ))
-
-        sent = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Sent",
-            scheduled_for=now_utc()
-        ))
+        pending, sent, cancelled = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() + timedelta(days=days)
+            )
+            for body, days in [("Pending", 1), ("Sent", 0), ("Cancelled", 2)]
+        ])
         message_service.mark_sent(sent.id)
-
-        cancelled = message_service.schedule(ScheduledMessageCreate(
-            customer_id=test_customer.id,
-            message_type=MessageType.CUSTOM,
-            body="Cancelled",
-            scheduled_for=now_utc() + timedelta(days=2)
-        ))
         message_service.cancel(cancelled.id)
 
         messages = message_service.list_for_customer(test_customer.id)
@@ -655,34 +660,92 @@ class TestMessageList:
         assert sent.id in message_ids
         assert cancelled.id in message_ids
 
-    def test_list_for_customer_ordered_by_scheduled_for_desc(self, db, as_test_user, message_service, test_customer):
+    def test_list_for_customer_ordered_by_scheduled_for_desc(self, as_test_user, message_service, test_customer, seed_messages):
         """Messages are ordered by scheduled_for descending (newest first)."""
-        from core.models import ScheduledMessageCreate, MessageType
+        first, second, third = seed_messages([
+            ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() + timedelta(days=days)
+            )
+            for body, days in [("First", 1), ("Second", 3), ("Third", 2)]
+        ])
+
+        messages = message_service.list_for_customer(test_customer.id)
 
-        first = message_service.schedule(ScheduledMessageCreate(
+        # Should be ordered: second (day 3), third (day 2), first (day 1)
+        assert messages[0].id == second.id
+        assert messages[1].id == third.id
+        assert messages[2].id == first.id
+
+    def test_list_for_customer_body_contains_filters(self, as_test_user, message_service, test_customer):
+        """body_contains keeps only messages whose body contains the text."""
+        match = message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
-            body="First",
+            body="Thanks for paying INV-0001",
             scheduled_for=now_utc() + timedelta(days=1)
         ))
-
-        second = message_service.schedule(ScheduledMessageCreate(
+        message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
-            body="Second",
-            scheduled_for=now_utc() + timedelta(days=3)
+            body="See you next week",
+            scheduled_for=now_utc() + timedelta(days=1)
         ))
 
-        third = message_service.schedule(ScheduledMessageCreate(
+        messages = message_service.list_for_customer(test_customer.id, body_contains="INV-0001")
+
+        assert [m.id for m in messages] == [match.id]
+
+    def test_list_for_customer_body_contains_is_literal(self, as_test_user, message_service, test_customer):
+        """LIKE wildcards in body_contains are matched literally."""
+        message_service.schedule(ScheduledMessageCreate(
             customer_id=test_customer.id,
             message_type=MessageType.CUSTOM,
-            body="Third",
-            scheduled_for=now_utc() + timedelta(days=2)
+            body="Plain body",
+            scheduled_for=now_utc() + timedelta(days=1)
         ))
 
-        messages = message_service.list_for_customer(test_customer.id)
+        assert message_service.list_for_customer(test_customer.id, body_contains="%") == []
+        assert message_service.list_for_customer(test_customer.id, body_contains="_") == []
 
-        # Should be ordered: second (day 3), third (day 2), first (day 1)
-        assert messages[0].id == second.id
-        assert messages[1].id == third.id
-        assert messages[2].id == first.id
+
+class TestMessageCount:
+    """Tests for counting messages."""
+
+    def test_count_for_customer(self, as_test_user, message_service, test_customer):
+        """count_for_customer counts all of a customer's messages."""
+        assert message_service.count_for_customer(test_customer.id) == 0
+
+        for body in ("One", "Two"):
+            message_service.schedule(ScheduledMessageCreate(
+                customer_id=test_customer.id,
+                message_type=MessageType.CUSTOM,
+                body=body,
+                scheduled_for=now_utc() + timedelta(days=1)
+            ))
+
+        assert message_service.count_for_customer(test_customer.id) == 2
+
+    def test_count_for_customer_filters(self, as_test_user, message_service, test_customer):
+        """status and body_contains narrow the count."""
+        kept = message_service.schedule(ScheduledMessageCreate(
+            customer_id=test_customer.id,
+            message_type=MessageType.CUSTOM,
+            body="Receipt for INV-0002",
+            scheduled_for=now_utc() + timedelta(days=1)
+        ))
+        cancelled = message_service.schedule(ScheduledMessageCreate(
+            customer_id=test_customer.id,
+            message_type=MessageType.CUSTOM,
+            body="Receipt for INV-0003",
+            scheduled_for=now_utc() + timedelta(days=1)
+        ))
+        message_service.cancel(cancelled.id)
+
+        assert message_service.count_for_customer(test_customer.id, status=MessageStatus.PENDING) == 1
+        assert message_service.count_for_customer(test_customer.id, body_contains="Receipt") == 2
+        assert message_service.count_for_customer(
+            test_customer.id, status=MessageStatus.PENDING, body_contains=str(kept.body)
+        ) == 1
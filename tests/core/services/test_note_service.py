@@ -1,85 +1,40 @@
 """Tests for NoteService."""
 
+import re
+
 import pytest
+from typing import NamedTuple
 from uuid import uuid4
-from datetime import timedelta
-
-from utils.timezone import now_utc
-
-
-@pytest.fixture
-def note_service(db, event_bus):
-    """NoteService with real DB."""
-    from core.services.note_service import NoteService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return NoteService(db, audit, event_bus)
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService for test setup."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
+from pydantic import ValidationError
 
-    return CustomerService(db, AuditLogger(db), event_bus)
+from core.events import NoteCreated
+from core.models import Note, NoteCreate
 
 
-@pytest.fixture
-def ticket_service(db, event_bus):
-    """TicketService for test setup."""
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-
-    return TicketService(db, AuditLogger(db), event_bus)
+# Validation message for misparented notes, compiled once for every case
+EXACTLY_ONE = re.compile(r"Exactly one")
 
 
 @pytest.fixture
-def address_service(db):
-    """AddressService for test setup."""
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
+def test_customer(as_test_user, seed_customer):
+    """Customer the notes hang off.
 
-    return AddressService(db, AuditLogger(db))
+    Notes are under test here, so their parents are seeded with raw INSERTs
+    rather than through the customer/address/ticket services.
+    """
+    return seed_customer(first_name="Note", last_name="Test")
 
 
 @pytest.fixture
-def test_customer(as_test_user, customer_service):
-    """Create a test customer."""
-    from core.models import CustomerCreate
-
-    customer = customer_service.create(CustomerCreate(first_name="Note", last_name="Test"))
-    yield customer
-    customer_service.delete(customer.id)
+def test_address(as_test_user, seed_address, test_customer):
+    """Address for test_customer."""
+    return seed_address(test_customer.id, street="789 Note Ave")
 
 
 @pytest.fixture
-def test_address(as_test_user, address_service, test_customer):
-    """Create a test address."""
-    from core.models import AddressCreate
-
-    return address_service.create(AddressCreate(
-        customer_id=test_customer.id,
-        street="789 Note Ave",
-        city="Austin",
-        state="TX",
-        zip="78703"
-    ))
-
-
-@pytest.fixture
-def test_ticket(as_test_user, ticket_service, test_customer, test_address):
-    """Create a test ticket."""
-    from core.models import TicketCreate
-
-    ticket = ticket_service.create(TicketCreate(
-        customer_id=test_customer.id,
-        address_id=test_address.id,
-        scheduled_at=now_utc() + timedelta(days=1)
-    ))
-    yield ticket
-    ticket_service.delete(ticket.id)
+def test_ticket(as_test_user, seed_ticket, test_customer, test_address):
+    """Ticket for test_customer at test_address."""
+    return seed_ticket(test_customer.id, test_address.id)
 
 
 class TestNoteCreate:
@@ -87,8 +42,6 @@ class TestNoteCreate:
 
     def test_creates_customer_note(self, db, as_test_user, note_service, test_customer):
         """Creates note attached to customer."""
-        from core.models import NoteCreate
-
         data = NoteCreate(
             customer_id=test_customer.id,
             content="Customer prefers morning appointments."
@@ -103,8 +56,6 @@ class TestNoteCreate:
 
     def test_creates_ticket_note(self, db, as_test_user, note_service, test_ticket):
         """Creates note attached to ticket."""
-        from core.models import NoteCreate
-
         data = NoteCreate(
             ticket_id=test_ticket.id,
             content="Used extra squeegee for stubborn spots."
@@ -116,25 +67,14 @@ class TestNoteCreate:
         assert note.customer_id is None
         assert note.content == "Used extra squeegee for stubborn spots."
 
-    def test_rejects_no_parent(self, db, as_test_user, note_service):
-        """Rejects note with no parent."""
-        from core.models import NoteCreate
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError, match="Exactly one"):
-            NoteCreate(content="Orphan note")
-
-    def test_rejects_both_parents(self, db, as_test_user, note_service, test_customer, test_ticket):
-        """Rejects note with both customer and ticket."""
-        from core.models import NoteCreate
-        from pydantic import ValidationError
-
-        with pytest.raises(ValidationError, match="Exactly one"):
-            NoteCreate(
-                customer_id=test_customer.id,
-                ticket_id=test_ticket.id,
-                content="Invalid dual parent"
-            )
+    @pytest.mark.parametrize("parents", [
+        pytest.param({}, id="no-parent"),
+        pytest.param({"customer_id": uuid4(), "ticket_id": uuid4()}, id="both-parents"),
+    ])
+    def test_rejects_invalid_parent(self, parents):
+        """Rejects note without exactly one of customer and ticket (pure validation, no DB)."""
+        with pytest.raises(ValidationError, match=EXACTLY_ONE):
+            NoteCreate(content="Misparented note", **parents)
 
 
 class TestNoteGet:
@@ -142,8 +82,6 @@ class TestNoteGet:
 
     def test_gets_note(self, db, as_test_user, note_service, test_customer):
         """Gets note by ID."""
-        from core.models import NoteCreate
-
         created = note_service.create(NoteCreate(
             customer_id=test_customer.id,
             content="Test note content."
@@ -164,54 +102,36 @@ class TestNoteGet:
 class TestNoteList:
     """Tests for NoteService list methods."""
 
-    def test_lists_customer_notes(self, db, as_test_user, note_service, test_customer):
+    def test_lists_customer_notes(self, db, as_test_user, note_service, seed_notes, test_customer):
         """Lists all notes for a customer."""
-        from core.models import NoteCreate
-
-        note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="First customer note"
-        ))
-        note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Second customer note"
-        ))
+        seed_notes([
+            NoteCreate(customer_id=test_customer.id, content="First customer note"),
+            NoteCreate(customer_id=test_customer.id, content="Second customer note"),
+        ])
 
         notes = note_service.list_for_customer(test_customer.id)
 
         assert len(notes) >= 2
         assert all(n.customer_id == test_customer.id for n in notes)
 
-    def test_lists_ticket_notes(self, db, as_test_user, note_service, test_ticket):
+    def test_lists_ticket_notes(self, db, as_test_user, note_service, seed_notes, test_ticket):
         """Lists all notes for a ticket."""
-        from core.models import NoteCreate
-
-        note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="First ticket note"
-        ))
-        note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="Second ticket note"
-        ))
+        seed_notes([
+            NoteCreate(ticket_id=test_ticket.id, content="First ticket note"),
+            NoteCreate(ticket_id=test_ticket.id, content="Second ticket note"),
+        ])
 
         notes = note_service.list_for_ticket(test_ticket.id)
 
         assert len(notes) >= 2
         assert all(n.ticket_id == test_ticket.id for n in notes)
 
-    def test_excludes_deleted_notes(self, db, as_test_user, note_service, test_customer):
+    def test_excludes_deleted_notes(self, db, as_test_user, note_service, seed_notes, test_customer):
         """list methods exclude soft-deleted notes."""
-        from core.models import NoteCreate
-
-        note1 = note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Keep this note"
-        ))
-        note2 = note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Delete this note"
-        ))
+        note1, note2 = seed_notes([
+            NoteCreate(customer_id=test_customer.id, content="Keep this note"),
+            NoteCreate(customer_id=test_customer.id, content="Delete this note"),
+        ])
 
         note_service.delete(note2.id)
 
@@ -227,8 +147,6 @@ class TestNoteDelete:
 
     def test_deletes_note(self, db, as_test_user, note_service, test_customer):
         """Soft deletes note."""
-        from core.models import NoteCreate
-
         note = note_service.create(NoteCreate(
             customer_id=test_customer.id,
             content="Note to delete"
@@ -247,13 +165,43 @@ class TestNoteDelete:
         assert result is False
 
 
+class NoteCorpus(NamedTuple):
+    unprocessed_customer_note: Note
+    unprocessed_ticket_note: Note
+    processed_ticket_note: Note
+    deleted_ticket_note: Note
+
+
+@pytest.fixture
+def note_corpus(db, as_test_user, seed_notes, test_customer, test_ticket):
+    """One note in each state the unprocessed queries distinguish.
+
+    Seeded in one INSERT plus one UPDATE; mark_processed and delete have
+    their own tests, so the corpus sets processed_at/deleted_at directly.
+    """
+    corpus = NoteCorpus(*seed_notes([
+        NoteCreate(customer_id=test_customer.id, content="Customer note, no ticket"),
+        NoteCreate(ticket_id=test_ticket.id, content="Not yet processed"),
+        NoteCreate(ticket_id=test_ticket.id, content="Already processed"),
+        NoteCreate(ticket_id=test_ticket.id, content="Will be deleted"),
+    ]))
+    db.execute(
+        """
+        UPDATE notes
+        SET processed_at = CASE WHEN id = %(processed)s THEN now() END,
+            deleted_at = CASE WHEN id = %(deleted)s THEN now() END
+        WHERE id IN (%(processed)s, %(deleted)s)
+        """,
+        {"processed": corpus.processed_ticket_note.id, "deleted": corpus.deleted_ticket_note.id}
+    )
+    return corpus
+
+
 class TestNoteProcessed:
     """Tests for marking notes as processed."""
 
     def test_mark_processed(self, db, as_test_user, note_service, test_customer):
         """Marks note as processed by LLM extraction."""
-        from core.models import NoteCreate
-
         note = note_service.create(NoteCreate(
             customer_id=test_customer.id,
             content="Customer mentioned they have 12 windows."
@@ -265,88 +213,48 @@ class TestNoteProcessed:
 
         assert updated.processed_at is not None
 
-    def test_list_unprocessed(self, db, as_test_user, note_service, test_customer):
-        """Lists notes that haven't been processed."""
-        from core.models import NoteCreate
-
-        note1 = note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Process this one"
-        ))
-        note2 = note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Already processed"
-        ))
-
-        note_service.mark_processed(note2.id)
-
+    def test_list_unprocessed(self, as_test_user, note_service, note_corpus):
+        """Lists notes that haven't been processed, skipping deleted ones."""
         unprocessed = note_service.list_unprocessed(limit=100)
         unprocessed_ids = [n.id for n in unprocessed]
 
-        assert note1.id in unprocessed_ids
-        assert note2.id not in unprocessed_ids
-
-    def test_list_unprocessed_for_ticket(self, db, as_test_user, note_service, test_customer, test_ticket):
-        """Returns only unprocessed notes for a specific ticket."""
-        from core.models import NoteCreate
-
-        unprocessed_note = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="Not yet processed"
-        ))
-        processed_note = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="Already processed"
-        ))
-        note_service.mark_processed(processed_note.id)
-
-        customer_note = note_service.create(NoteCreate(
-            customer_id=test_customer.id,
-            content="Customer note, no ticket"
-        ))
+        assert note_corpus.unprocessed_customer_note.id in unprocessed_ids
+        assert note_corpus.unprocessed_ticket_note.id in unprocessed_ids
+        assert note_corpus.processed_ticket_note.id not in unprocessed_ids
+        assert note_corpus.deleted_ticket_note.id not in unprocessed_ids
 
+    def test_list_unprocessed_for_ticket(self, as_test_user, note_service, note_corpus, test_ticket):
+        """Returns only the ticket's notes that are neither processed nor deleted."""
         result = note_service.list_unprocessed_for_ticket(test_ticket.id)
-        result_ids = [n.id for n in result]
 
-        assert unprocessed_note.id in result_ids
-        assert processed_note.id not in result_ids
-        assert customer_note.id not in result_ids
+        assert [n.id for n in result] == [note_corpus.unprocessed_ticket_note.id]
 
     def test_list_unprocessed_for_ticket_empty(self, db, as_test_user, note_service, test_ticket):
         """Returns empty list when ticket has no unprocessed notes."""
         result = note_service.list_unprocessed_for_ticket(test_ticket.id)
         assert result == []
 
-    def test_list_unprocessed_for_ticket_excludes_deleted(self, db, as_test_user, note_service, test_ticket):
-        """Deleted notes are excluded even if unprocessed."""
-        from core.models import NoteCreate
-
-        note = note_service.create(NoteCreate(
-            ticket_id=test_ticket.id,
-            content="Will be deleted"
-        ))
-        note_service.delete(note.id)
-
-        result = note_service.list_unprocessed_for_ticket(test_ticket.id)
-        assert result == []
-
 
 class TestNoteEventPublishing:
     """Verify that NoteService publishes domain events to the bus."""
 
-    def test_create_publishes_note_created(self, db, as_test_user, note_service, event_bus, test_customer):
-        from core.models import NoteCreate
-        from core.events import NoteCreated
+    @pytest.fixture
+    def note_events(self, event_bus):
+        """NoteCreated events published during the test, in order.
 
+        No unsubscribe needed: reset_event_bus clears the bus afterwards.
+        """
         received = []
         event_bus.subscribe("NoteCreated", received.append)
+        return received
 
+    def test_create_publishes_note_created(self, db, as_test_user, note_service, note_events, test_customer):
         note = note_service.create(NoteCreate(
             customer_id=test_customer.id,
             content="Elderly woman, dog named Biscuit"
         ))
 
-        assert len(received) == 1
-        assert isinstance(received[0], NoteCreated)
-        assert received[0].note.id == note.id
-        assert received[0].note.content == "Elderly woman, dog named Biscuit"
+        assert len(note_events) == 1
+        assert isinstance(note_events[0], NoteCreated)
+        assert note_events[0].note.id == note.id
+        assert note_events[0].note.content == "Elderly woman, dog named Biscuit"
@@ -1,62 +1,53 @@
 """Tests for TicketService."""
 
+import re
+
 import pytest
-from uuid import uuid4
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 
+from core.events import TicketCreated, TicketClockIn, TicketCompleted, TicketCancelled
+from core.models import TicketCreate, TicketStatus, TicketUpdate, CustomerCreate
 from utils.timezone import now_utc
 
 
-@pytest.fixture
-def ticket_service(db, event_bus):
-    """TicketService with real DB."""
-    from core.services.ticket_service import TicketService
-    from core.audit import AuditLogger
-
-    audit = AuditLogger(db)
-    return TicketService(db, audit, event_bus)
-
-
-@pytest.fixture
-def customer_service(db, event_bus):
-    """CustomerService for test setup."""
-    from core.services.customer_service import CustomerService
-    from core.audit import AuditLogger
+# Rejection messages, compiled once for every test that expects them
+ALREADY_CLOCKED_IN = re.compile(r"already clocked in")
+NOT_CLOCKED_IN = re.compile(r"not clocked in")
+CLOSED_IMMUTABLE = re.compile(r"closed.*immutable")
+CANNOT_CANCEL = re.compile(r"cannot cancel")
 
-    return CustomerService(db, AuditLogger(db), event_bus)
+# Scheduling dates for test tickets, computed once; any future time will do
+_TOMORROW = now_utc() + timedelta(days=1)
+_NEXT_WEEK = now_utc() + timedelta(days=7)
 
 
 @pytest.fixture
-def address_service(db):
-    """AddressService for test setup."""
-    from core.services.address_service import AddressService
-    from core.audit import AuditLogger
+def test_customer(as_test_user, seed_customer):
+    """Customer the tickets are for.
 
-    return AddressService(db, AuditLogger(db))
+    Tickets are under test here, so their parents are seeded with raw
+    INSERTs rather than through the customer/address services.
+    """
+    return seed_customer(first_name="Test", last_name="Customer")
 
 
 @pytest.fixture
-def test_customer(as_test_user, customer_service):
-    """Create a test customer."""
-    from core.models import CustomerCreate
-
-    customer = customer_service.create(CustomerCreate(first_name="Test", last_name="Customer"))
-    yield customer
-    customer_service.delete(customer.id)
+def test_address(as_test_user, seed_address, test_customer):
+    """Address for test_customer."""
+    return seed_address(test_customer.id, street="123 Test St")
 
 
 @pytest.fixture
-def test_address(as_test_user, address_service, test_customer):
-    """Create a test address."""
-    from core.models import AddressCreate
-
-    return address_service.create(AddressCreate(
+def closed_ticket(as_test_user, ticket_service, test_customer, test_address):
+    """A ticket taken through the full lifecycle: create, clock in, clock out, close."""
+    ticket = ticket_service.create(TicketCreate(
         customer_id=test_customer.id,
-        street="123 Test St",
-        city="Austin",
-        state="TX",
-        zip="78701"
+        address_id=test_address.id,
+        scheduled_at=_TOMORROW
     ))
+    ticket_service.clock_in(ticket.id)
+    ticket_service.clock_out(ticket.id)
+    return ticket_service.close(ticket.id)
 
 
 class TestTicketCreate:
@@ -64,13 +55,10 @@ class TestTicketCreate:
 
     def test_creates_ticket(self, db, as_test_user, ticket_service, test_customer, test_address):
         """Creates ticket with provided data."""
-        from core.models import TicketCreate, TicketStatus
-
-        scheduled = now_utc() + timedelta(days=1)
         data = TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=scheduled
+            scheduled_at=_TOMORROW
         )
 
         ticket = ticket_service.create(data)
@@ -81,12 +69,10 @@ class TestTicketCreate:
 
     def test_starts_with_scheduled_status(self, db, as_test_user, ticket_service, test_customer, test_address):
         """New tickets start in SCHEDULED status."""
-        from core.models import TicketCreate, TicketStatus
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         assert ticket.status == TicketStatus.SCHEDULED
@@ -100,12 +86,10 @@ class TestTicketClockIn:
 
     def test_clock_in_sets_time_and_status(self, db, as_test_user, ticket_service, test_customer, test_address):
         """clock_in sets clock_in_at and status to IN_PROGRESS."""
-        from core.models import TicketCreate, TicketStatus
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         updated = ticket_service.clock_in(ticket.id)
@@ -113,38 +97,23 @@ class TestTicketClockIn:
         assert updated.clock_in_at is not None
         assert updated.status == TicketStatus.IN_PROGRESS
 
-    def test_clock_in_rejects_non_scheduled(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_clock_in_rejects_non_scheduled(self, as_test_user, ticket_service, closed_ticket):
         """Cannot clock into completed ticket (already clocked in takes precedence)."""
-        from core.models import TicketCreate
-
-        ticket = ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
-        ))
-
-        # Clock in, clock out, close
-        ticket_service.clock_in(ticket.id)
-        ticket_service.clock_out(ticket.id)
-        ticket_service.close(ticket.id)
-
         # Since we already clocked in, that's the error we get (more specific)
-        with pytest.raises(ValueError, match="already clocked in"):
-            ticket_service.clock_in(ticket.id)
+        with pytest.raises(ValueError, match=ALREADY_CLOCKED_IN):
+            ticket_service.clock_in(closed_ticket.id)
 
     def test_clock_in_rejects_already_clocked(self, db, as_test_user, ticket_service, test_customer, test_address):
         """Cannot clock in twice."""
-        from core.models import TicketCreate
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         ticket_service.clock_in(ticket.id)
 
-        with pytest.raises(ValueError, match="already clocked in"):
+        with pytest.raises(ValueError, match=ALREADY_CLOCKED_IN):
             ticket_service.clock_in(ticket.id)
 
 
@@ -153,12 +122,10 @@ class TestTicketClockOut:
 
     def test_clock_out_calculates_duration(self, db, as_test_user, ticket_service, test_customer, test_address):
         """clock_out sets clock_out_at and calculates duration."""
-        from core.models import TicketCreate
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         ticket_service.clock_in(ticket.id)
@@ -170,54 +137,28 @@ class TestTicketClockOut:
 
     def test_clock_out_requires_clock_in(self, db, as_test_user, ticket_service, test_customer, test_address):
         """Cannot clock out without clocking in first."""
-        from core.models import TicketCreate
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
-        with pytest.raises(ValueError, match="not clocked in"):
+        with pytest.raises(ValueError, match=NOT_CLOCKED_IN):
             ticket_service.clock_out(ticket.id)
 
 
 class TestTicketClose:
     """Tests for TicketService.close."""
 
-    def test_close_marks_completed(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_close_marks_completed(self, closed_ticket):
         """close sets status to COMPLETED and closed_at."""
-        from core.models import TicketCreate, TicketStatus
+        assert closed_ticket.status == TicketStatus.COMPLETED
+        assert closed_ticket.closed_at is not None
 
-        ticket = ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
-        ))
-
-        ticket_service.clock_in(ticket.id)
-        ticket_service.clock_out(ticket.id)
-        closed = ticket_service.close(ticket.id)
-
-        assert closed.status == TicketStatus.COMPLETED
-        assert closed.closed_at is not None
-
-    def test_closed_ticket_immutable(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_closed_ticket_immutable(self, as_test_user, ticket_service, closed_ticket):
         """Cannot modify closed ticket."""
-        from core.models import TicketCreate, TicketUpdate
-
-        ticket = ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
-        ))
-
-        ticket_service.clock_in(ticket.id)
-        ticket_service.clock_out(ticket.id)
-        ticket_service.close(ticket.id)
-
-        with pytest.raises(ValueError, match="closed.*immutable"):
-            ticket_service.update(ticket.id, TicketUpdate(notes="New notes"))
+        with pytest.raises(ValueError, match=CLOSED_IMMUTABLE):
+            ticket_service.update(closed_ticket.id, TicketUpdate(notes="New notes"))
 
 
 class TestTicketCancel:
@@ -225,56 +166,31 @@ class TestTicketCancel:
 
     def test_cancel_sets_status(self, db, as_test_user, ticket_service, test_customer, test_address):
         """cancel sets status to CANCELLED."""
-        from core.models import TicketCreate, TicketStatus
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         cancelled = ticket_service.cancel(ticket.id)
 
         assert cancelled.status == TicketStatus.CANCELLED
 
-    def test_cannot_cancel_completed(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_cannot_cancel_completed(self, as_test_user, ticket_service, closed_ticket):
         """Cannot cancel a completed ticket."""
-        from core.models import TicketCreate
-
-        ticket = ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
-        ))
-
-        ticket_service.clock_in(ticket.id)
-        ticket_service.clock_out(ticket.id)
-        ticket_service.close(ticket.id)
-
-        with pytest.raises(ValueError, match="cannot cancel"):
-            ticket_service.cancel(ticket.id)
+        with pytest.raises(ValueError, match=CANNOT_CANCEL):
+            ticket_service.cancel(closed_ticket.id)
 
 
 class TestTicketList:
     """Tests for TicketService list methods."""
 
-    def test_list_by_date_range(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_list_by_date_range(self, db, as_test_user, ticket_service, seed_tickets, test_customer, test_address):
         """list_by_date_range returns tickets in range."""
-        from core.models import TicketCreate
-
-        tomorrow = now_utc() + timedelta(days=1)
-        next_week = now_utc() + timedelta(days=7)
-
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=tomorrow
-        ))
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=next_week
-        ))
+        seed_tickets([
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=_TOMORROW),
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=_NEXT_WEEK),
+        ])
 
         # Query for tomorrow only
         start = now_utc()
@@ -284,25 +200,25 @@ class TestTicketList:
         assert len(tickets) >= 1
         assert all(start <= t.scheduled_at <= end for t in tickets)
 
-    def test_list_for_customer(self, db, as_test_user, ticket_service, customer_service, test_address):
+    def test_list_for_customer(self, db, as_test_user, ticket_service, customer_service, seed_tickets, test_address):
         """list_for_customer returns only that customer's tickets."""
-        from core.models import TicketCreate, CustomerCreate, AddressCreate
-
         # Create two customers
         customer_a = customer_service.create(CustomerCreate(first_name="Customer A"))
         customer_b = customer_service.create(CustomerCreate(first_name="Customer B"))
 
         # Use same address for simplicity (belongs to test_customer but we'll ignore for this test)
-        ticket_service.create(TicketCreate(
-            customer_id=customer_a.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
-        ))
-        ticket_service.create(TicketCreate(
-            customer_id=customer_b.id,
-            address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=2)
-        ))
+        seed_tickets([
+            TicketCreate(
+                customer_id=customer_a.id,
+                address_id=test_address.id,
+                scheduled_at=_TOMORROW
+            ),
+            TicketCreate(
+                customer_id=customer_b.id,
+                address_id=test_address.id,
+                scheduled_at=now_utc() + timedelta(days=2)
+            ),
+        ])
 
         tickets_a = ticket_service.list_for_customer(customer_a.id)
         tickets_b = ticket_service.list_for_customer(customer_b.id)
@@ -312,44 +228,28 @@ class TestTicketList:
         assert len(tickets_b) == 1
         assert tickets_b[0].customer_id == customer_b.id
 
-        # Cleanup
-        customer_service.delete(customer_a.id)
-        customer_service.delete(customer_b.id)
-
 
 class TestTicketListToday:
     """Tests for TicketService.list_today."""
 
-    def test_returns_tickets_scheduled_today(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_returns_tickets_scheduled_today(self, db, as_test_user, ticket_service, seed_tickets, test_customer, test_address):
         """list_today returns only today's tickets."""
-        from core.models import TicketCreate
-        from datetime import time, timezone
-
         today = now_utc().date()
         today_morning = datetime.combine(today, time(9, 0), tzinfo=timezone.utc)
         tomorrow_morning = datetime.combine(today + timedelta(days=1), time(9, 0), tzinfo=timezone.utc)
 
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=today_morning
-        ))
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=tomorrow_morning
-        ))
+        seed_tickets([
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=today_morning),
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=tomorrow_morning),
+        ])
 
-        tickets = ticket_service.list_today()
+        tickets = [t for t in ticket_service.list_today() if t.customer_id == test_customer.id]
 
         assert len(tickets) == 1
         assert tickets[0].scheduled_at.date() == today
 
     def test_returns_empty_when_no_tickets_today(self, db, as_test_user, ticket_service, test_customer, test_address):
         """list_today returns empty list when no tickets scheduled today."""
-        from core.models import TicketCreate
-        from datetime import time, timezone
-
         tomorrow = now_utc().date() + timedelta(days=1)
         ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
@@ -357,31 +257,22 @@ class TestTicketListToday:
             scheduled_at=datetime.combine(tomorrow, time(9, 0), tzinfo=timezone.utc)
         ))
 
-        tickets = ticket_service.list_today()
+        tickets = [t for t in ticket_service.list_today() if t.customer_id == test_customer.id]
 
         assert tickets == []
 
-    def test_ordered_by_scheduled_at(self, db, as_test_user, ticket_service, test_customer, test_address):
+    def test_ordered_by_scheduled_at(self, db, as_test_user, ticket_service, seed_tickets, test_customer, test_address):
         """list_today orders tickets by scheduled_at ascending."""
-        from core.models import TicketCreate
-        from datetime import time, timezone
-
         today = now_utc().date()
         afternoon = datetime.combine(today, time(14, 0), tzinfo=timezone.utc)
         morning = datetime.combine(today, time(8, 0), tzinfo=timezone.utc)
 
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=afternoon
-        ))
-        ticket_service.create(TicketCreate(
-            customer_id=test_customer.id,
-            address_id=test_address.id,
-            scheduled_at=morning
-        ))
+        seed_tickets([
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=afternoon),
+            TicketCreate(customer_id=test_customer.id, address_id=test_address.id, scheduled_at=morning),
+        ])
 
-        tickets = ticket_service.list_today()
+        tickets = [t for t in ticket_service.list_today() if t.customer_id == test_customer.id]
 
         assert len(tickets) == 2
         assert tickets[0].scheduled_at < tickets[1].scheduled_at
@@ -392,8 +283,6 @@ class TestTicketGetCurrent:
 
     def test_returns_in_progress_ticket(self, db, as_test_user, ticket_service, test_customer, test_address):
         """get_current returns in-progress ticket."""
-        from core.models import TicketCreate, TicketStatus
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -409,8 +298,6 @@ class TestTicketGetCurrent:
 
     def test_returns_none_when_only_scheduled(self, db, as_test_user, ticket_service, test_customer, test_address):
         """get_current returns None when tickets exist but none are in-progress."""
-        from core.models import TicketCreate
-
         ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -432,16 +319,13 @@ class TestTicketEventPublishing:
     """Verify that TicketService publishes domain events to the bus."""
 
     def test_create_publishes_ticket_created(self, db, as_test_user, ticket_service, event_bus, test_customer, test_address):
-        from core.models import TicketCreate
-        from core.events import TicketCreated
-
         received = []
         event_bus.subscribe("TicketCreated", received.append)
 
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
-            scheduled_at=now_utc() + timedelta(days=1)
+            scheduled_at=_TOMORROW
         ))
 
         assert len(received) == 1
@@ -450,9 +334,6 @@ class TestTicketEventPublishing:
         assert received[0].ticket.customer_id == test_customer.id
 
     def test_clock_in_publishes_ticket_clock_in(self, db, as_test_user, ticket_service, event_bus, test_customer, test_address):
-        from core.models import TicketCreate
-        from core.events import TicketClockIn
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -470,9 +351,6 @@ class TestTicketEventPublishing:
         assert received[0].ticket.clock_in_at is not None
 
     def test_close_publishes_ticket_completed(self, db, as_test_user, ticket_service, event_bus, test_customer, test_address):
-        from core.models import TicketCreate, TicketStatus
-        from core.events import TicketCompleted
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -490,9 +368,6 @@ class TestTicketEventPublishing:
         assert received[0].ticket.status == TicketStatus.COMPLETED
 
     def test_cancel_publishes_ticket_cancelled(self, db, as_test_user, ticket_service, event_bus, test_customer, test_address):
-        from core.models import TicketCreate, TicketStatus
-        from core.events import TicketCancelled
-
         ticket = ticket_service.create(TicketCreate(
             customer_id=test_customer.id,
             address_id=test_address.id,
@@ -1,6 +1,7 @@
 """Tests for universal audit trail."""
 
 import pytest
+from unittest.mock import Mock
 from uuid import uuid4
 
 
@@ -137,7 +138,7 @@ class TestAuditLogger:
         )
 
         entries = db.execute(
-            "SELECT user_id FROM audit_log WHERE entity_id = %s",
+            "SELECT user_id FROM audit_log WHERE entity_type = 'customer' AND entity_id = %s",
             (entity_id,)
         )
         assert entries[0]["user_id"] == test_user_id
@@ -158,7 +159,7 @@ class TestAuditLogger:
         )
 
         entries = db.execute(
-            "SELECT user_id FROM audit_log WHERE entity_id = %s",
+            "SELECT user_id FROM audit_log WHERE entity_type = 'customer' AND entity_id = %s",
             (entity_id,)
         )
         assert entries[0]["user_id"] == test_user_b_id
@@ -182,16 +183,97 @@ class TestAuditLogger:
         )
 
         entries = db.execute(
-            "SELECT changes FROM audit_log WHERE entity_id = %s",
+            "SELECT changes FROM audit_log WHERE entity_type = 'customer' AND entity_id = %s",
             (entity_id,)
         )
         # JSONB comes back as dict
         assert entries[0]["changes"] == changes_data
 
+    def test_batch_writes_one_entry_per_entity(self, db, as_test_user, test_user_id):
+        """A batch COPYs each entity's changes under the context user."""
+        from core.audit import AuditLogger, AuditAction
+
+        logger = AuditLogger(db)
+        entries = [(uuid4(), {"created": {"n": i}}) for i in range(3)]
+
+        with logger.batch():
+            for entity_id, changes in entries:
+                logger.log_change("customer", entity_id, AuditAction.CREATE, changes)
+
+        rows = db.execute(
+            "SELECT entity_id, user_id, action, changes FROM audit_log "
+            "WHERE entity_type = 'customer' AND entity_id = ANY(%s)",
+            ([entity_id for entity_id, _ in entries],)
+        )
+        stored = {row["entity_id"]: row for row in rows}
+        assert len(stored) == 3
+        for entity_id, changes in entries:
+            assert stored[entity_id]["changes"] == changes
+            assert stored[entity_id]["action"] == "create"
+            assert stored[entity_id]["user_id"] == test_user_id
+
+    def test_batch_defers_writes_until_exit(self, db, as_test_user):
+        """Entries logged inside batch() land together when the block exits."""
+        from core.audit import AuditLogger, AuditAction
+
+        logger = AuditLogger(db)
+        created_id, updated_id = uuid4(), uuid4()
+
+        with logger.batch():
+            logger.log_change("customer", created_id, AuditAction.CREATE, {"created": {}})
+            logger.log_change("ticket", updated_id, AuditAction.UPDATE, {"status": {"old": "a", "new": "b"}})
+
+            pending = db.execute_scalar(
+                "SELECT COUNT(*) FROM audit_log WHERE entity_id = ANY(%s)",
+                ([created_id, updated_id],)
+            )
+            assert pending == 0
+
+        rows = db.execute(
+            "SELECT entity_type, action FROM audit_log WHERE entity_id = ANY(%s) ORDER BY entity_type",
+            ([created_id, updated_id],)
+        )
+        assert rows == [
+            {"entity_type": "customer", "action": "create"},
+            {"entity_type": "ticket", "action": "update"},
+        ]
+
+    def test_batch_flushes_when_block_raises(self, db, as_test_user):
+        """Already-logged entries are written even if the block fails afterwards."""
+        from core.audit import AuditLogger, AuditAction
+
+        logger = AuditLogger(db)
+        entity_id = uuid4()
+
+        with pytest.raises(RuntimeError):
+            with logger.batch():
+                logger.log_change("customer", entity_id, AuditAction.DELETE, {"deleted": {}})
+                raise RuntimeError("boom")
+
+        count = db.execute_scalar(
+            "SELECT COUNT(*) FROM audit_log WHERE entity_type = 'customer' AND entity_id = %s",
+            (entity_id,)
+        )
+        assert count == 1
+
+    def test_batch_flush_failure_is_chained_to_block_error(self, as_test_user):
+        """A failing flush after a failing block keeps the block's error as the cause."""
+        from core.audit import AuditLogger, AuditAction
+
+        postgres = Mock()
+        postgres.copy_rows.side_effect = ConnectionError("db down")
+        logger = AuditLogger(postgres)
+
+        with pytest.raises(ConnectionError) as raised:
+            with logger.batch():
+                logger.log_change("customer", uuid4(), AuditAction.DELETE, {"deleted": {}})
+                raise RuntimeError("boom")
+
+        assert isinstance(raised.value.__cause__, RuntimeError)
+
     def test_get_entity_history_returns_ordered(self, db, as_test_user):
         """History returned newest-first."""
         from core.audit import AuditLogger, AuditAction
-        import time
 
         logger = AuditLogger(db)
         entity_id = uuid4()
@@ -203,7 +285,6 @@ class TestAuditLogger:
             action=AuditAction.CREATE,
             changes={"created": {"name": "V1"}}
         )
-        time.sleep(0.01)  # Ensure different timestamps
         logger.log_change(
             entity_type="customer",
             entity_id=entity_id,
@@ -256,6 +337,24 @@ class TestAuditLogger:
 
         assert len(activity) == 3
 
+    def test_get_user_activity_orders_same_timestamp_by_insertion(self, db, as_test_user, monkeypatch):
+        """Entries sharing a created_at come back newest-inserted first."""
+        from core.audit import AuditLogger, AuditAction
+        from utils.timezone import now_utc
+
+        same_instant = now_utc()
+        monkeypatch.setattr("core.audit.now_utc", lambda: same_instant)
+        logger = AuditLogger(db)
+        entity_ids = [uuid4() for _ in range(3)]
+
+        with logger.batch():
+            for entity_id in entity_ids:
+                logger.log_change("customer", entity_id, AuditAction.CREATE, {"created": {}})
+
+        activity = logger.get_user_activity()
+
+        assert [row["entity_id"] for row in activity] == entity_ids[::-1]
+
     def test_get_user_activity_filters_by_user(self, db, as_test_user, as_test_user_b, test_user_id, test_user_b_id):
         """Activity only for requested user."""
         from core.audit import AuditLogger, AuditAction
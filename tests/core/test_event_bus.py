@@ -123,6 +123,28 @@ class TestSubscribeAndPublish:
         assert received[0].event_id != received[1].event_id
 
 
+# =============================================================================
+# CLEAR
+# =============================================================================
+
+
+class TestClear:
+    """Tests for EventBus.clear."""
+
+    def test_clear_removes_all_subscribers(self, _ticket, _customer, as_test_user):
+        """After clear(), no previously subscribed handler receives any event type."""
+        bus = EventBus()
+        received = []
+        bus.subscribe("TicketCreated", received.append)
+        bus.subscribe("CustomerCreated", received.append)
+
+        bus.clear()
+        bus.publish(TicketCreated.create(ticket=_ticket))
+        bus.publish(CustomerCreated.create(customer=_customer))
+
+        assert received == []
+
+
 # =============================================================================
 # HANDLER ERROR ISOLATION
 # =============================================================================
@@ -1,5 +1,6 @@
 """Tests for AttributeExtractor."""
 
+import json
 import pytest
 from decimal import Decimal
 from unittest.mock import Mock, patch
@@ -62,6 +63,22 @@ class TestAttributeExtractor:
 
         assert result.attributes.get("pet") == "cat"
 
+    def test_ignores_text_around_json_object(self):
+        """Parses the JSON object out of a response with preamble and code fences."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(
+            content='Here you go:\n```json\n{"pet": "dog"}\n```',
+            raw_response=None
+        )
+
+        extractor = AttributeExtractor(mock_llm)
+        result = extractor.extract_attributes("Has a dog")
+
+        assert result.attributes == {"pet": "dog"}
+
     def test_returns_empty_dict_on_unrepairable_json(self):
         """Returns empty attributes when JSON cannot be repaired."""
         from core.extraction import AttributeExtractor
@@ -116,6 +133,152 @@ class TestAttributeExtractor:
         assert messages[1]["role"] == "user"
         assert "Customer has 2 large dogs" in messages[1]["content"]
 
+    def test_reuses_extraction_for_same_notes(self):
+        """Identical notes are served from the cache without another LLM call."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(content='{"pet": "cat"}', raw_response=None)
+
+        extractor = AttributeExtractor(mock_llm)
+        first = extractor.extract_attributes("Cat indoors, regular clean")
+        second = extractor.extract_attributes("Cat indoors, regular clean")
+
+        assert mock_llm.generate.call_count == 1
+        assert second.attributes == first.attributes
+
+    def test_evicts_least_recently_used_notes(self):
+        """Cache holds at most cache_size notes, dropping the stalest."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(content='{"pet": "cat"}', raw_response=None)
+
+        extractor = AttributeExtractor(mock_llm, cache_size=2)
+        for notes in ("A", "B", "A", "C", "A", "B"):
+            extractor.extract_attributes(notes)
+
+        # A stays cached throughout; B is evicted by C and re-extracted
+        assert [c.kwargs["messages"][1]["content"][-1] for c in mock_llm.generate.call_args_list] == ["A", "B", "C", "B"]
+
+    def test_cache_keyed_by_prompt_version(self):
+        """Bumping PROMPT_VERSION stops earlier extractions from being reused."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(content='{"pet": "cat"}', raw_response=None)
+
+        extractor = AttributeExtractor(mock_llm)
+        extractor.extract_attributes("Has a cat")
+        extractor.PROMPT_VERSION = "next"
+        extractor.extract_attributes("Has a cat")
+
+        assert mock_llm.generate.call_count == 2
+
+    def test_batch_results_not_served_to_single_extraction(self):
+        """Batch-prompt and single-prompt extractions are cached separately."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.side_effect = [
+            LLMResponse(content='{"0": {"pet": "cat"}, "1": {"pet": "dog"}}', raw_response=None),
+            LLMResponse(content='{"pet": "cat"}', raw_response=None),
+        ]
+
+        extractor = AttributeExtractor(mock_llm)
+        extractor.extract_attributes_batch(["Has a cat", "Has a dog"])
+        extractor.extract_attributes("Has a cat")
+
+        assert mock_llm.generate.call_count == 2
+
+    def test_batch_extracts_all_notes_in_one_call(self):
+        """Several notes go to the LLM together; results come back in input order."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(
+            content='{"0": {"pet": "cat"}, "1": {"pet": "dog"}}',
+            raw_response=None
+        )
+
+        extractor = AttributeExtractor(mock_llm)
+        results = extractor.extract_attributes_batch(["Has a cat", "Has a dog"])
+
+        mock_llm.generate.assert_called_once()
+        assert [r.attributes for r in results] == [{"pet": "cat"}, {"pet": "dog"}]
+
+    def test_batch_retries_notes_missing_from_response(self):
+        """A note the batch response skipped is extracted on its own."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        mock_llm = Mock()
+        mock_llm.generate.side_effect = [
+            LLMResponse(content='{"0": {"pet": "cat"}}', raw_response=None),
+            LLMResponse(content='{"pet": "dog"}', raw_response=None),
+        ]
+
+        extractor = AttributeExtractor(mock_llm)
+        results = extractor.extract_attributes_batch(["Has a cat", "Has a dog"])
+
+        assert mock_llm.generate.call_count == 2
+        assert "Has a dog" in mock_llm.generate.call_args.kwargs["messages"][1]["content"]
+        assert [r.attributes for r in results] == [{"pet": "cat"}, {"pet": "dog"}]
+
+    def test_batch_sends_one_call_per_chunk(self):
+        """Notes are split into BATCH_SIZE chunks, each one capped LLM call."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        notes = [f"Note {i}" for i in range(AttributeExtractor.BATCH_SIZE + 2)]
+        mock_llm = Mock()
+        mock_llm.generate.side_effect = [
+            LLMResponse(content=json.dumps({str(i): {"n": i} for i in range(AttributeExtractor.BATCH_SIZE)}), raw_response=None),
+            LLMResponse(content=json.dumps({str(i): {"n": i} for i in range(AttributeExtractor.BATCH_SIZE, len(notes))}), raw_response=None),
+        ]
+
+        extractor = AttributeExtractor(mock_llm)
+        results = extractor.extract_attributes_batch(notes)
+
+        assert mock_llm.generate.call_count == 2
+        assert all(
+            c.kwargs["max_tokens"] <= AttributeExtractor.MAX_BATCH_TOKENS
+            for c in mock_llm.generate.call_args_list
+        )
+        assert [r.attributes for r in results] == [{"n": i} for i in range(len(notes))]
+
+    def test_batch_call_errors_propagate(self):
+        """A failing batch LLM call raises instead of retrying every note on its own."""
+        from core.extraction import AttributeExtractor
+
+        mock_llm = Mock()
+        mock_llm.generate.side_effect = RuntimeError("upstream timeout")
+
+        extractor = AttributeExtractor(mock_llm)
+        with pytest.raises(RuntimeError, match="upstream timeout"):
+            extractor.extract_attributes_batch(["Has a fish", "Also a fish"])
+
+        mock_llm.generate.assert_called_once()
+
+    def test_batch_keeps_raw_llm_response(self):
+        """raw_response holds the LLM's actual output, not re-serialized attributes."""
+        from core.extraction import AttributeExtractor
+        from clients.llm_client import LLMResponse
+
+        content = '{"0": {"pet": "cat"}, "1": {"pet": "dog"}}'
+        mock_llm = Mock()
+        mock_llm.generate.return_value = LLMResponse(content=content, raw_response=None)
+
+        extractor = AttributeExtractor(mock_llm)
+        results = extractor.extract_attributes_batch(["Has a cat", "Has a dog"])
+
+        assert [r.raw_response for r in results] == [content, content]
+
     def test_confidence_is_decimal(self):
         """Confidence is returned as Decimal."""
         from core.extraction import AttributeExtractor
@@ -7,7 +7,7 @@ import pytest
 from utils.user_context import (
     get_current_user_id,
     set_current_user_id,
-    clear_current_user_id,
+    reset_current_user_id,
     user_context,
 )
 
@@ -17,35 +17,55 @@ class TestGetCurrentUserId:
 
     def test_raises_without_set(self):
         """Must raise RuntimeError when no context is set."""
-        clear_current_user_id()  # Ensure clean state
         with pytest.raises(RuntimeError, match="No user context"):
             get_current_user_id()
 
 
-class TestSetAndClear:
-    """Tests for set_current_user_id() and clear_current_user_id()."""
+class TestSetAndReset:
+    """Tests for set_current_user_id() and reset_current_user_id()."""
 
     def test_set_then_get_returns_uuid(self):
         """Setting then getting should return the same UUID."""
         user_id = uuid4()
-        set_current_user_id(user_id)
+        token = set_current_user_id(user_id)
         assert get_current_user_id() == user_id
-        clear_current_user_id()
+        reset_current_user_id(token)
 
-    def test_clear_then_get_raises(self):
-        """Clearing then getting should raise RuntimeError."""
-        set_current_user_id(uuid4())
-        clear_current_user_id()
+    def test_reset_restores_previous(self):
+        """Resetting with the token from set restores whatever was set before."""
+        outer_id = uuid4()
+        outer_token = set_current_user_id(outer_id)
+
+        token = set_current_user_id(uuid4())
+        reset_current_user_id(token)
+
+        assert get_current_user_id() == outer_id
+        reset_current_user_id(outer_token)
+
+    def test_reset_to_unset_then_get_raises(self):
+        """Resetting back to no context then getting should raise RuntimeError."""
+        token = set_current_user_id(uuid4())
+        reset_current_user_id(token)
         with pytest.raises(RuntimeError):
             get_current_user_id()
 
+    def test_set_none_leaves_no_user(self):
+        """Setting None leaves no user until the token is reset."""
+        outer_token = set_current_user_id(uuid4())
+
+        token = set_current_user_id(None)
+        with pytest.raises(RuntimeError):
+            get_current_user_id()
+
+        reset_current_user_id(token)
+        reset_current_user_id(outer_token)
+
 
 class TestUserContextManager:
     """Tests for user_context() context manager."""
 
     def test_sets_and_clears(self):
         """Context manager should set inside, clear after."""
-        clear_current_user_id()  # Ensure clean state
         user_id = uuid4()
 
         with user_context(user_id):
@@ -69,7 +89,6 @@ class TestUserContextManager:
 
     def test_clears_on_exception(self):
         """Context should be cleared even if exception is raised."""
-        clear_current_user_id()
         user_id = uuid4()
 
         with pytest.raises(ValueError):
@@ -1,6 +1,6 @@
 """Propagate user identity through the call stack using contextvars."""
 
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from uuid import UUID
 from contextlib import contextmanager
 
@@ -24,23 +24,23 @@ def get_current_user_id() -> UUID:
     return user_id
 
 
-def set_current_user_id(user_id: UUID) -> None:
+def set_current_user_id(user_id: UUID | None) -> Token:
     """
-    Set current user ID in context.
+    Set current user ID in context (None leaves no user set).
 
     Called by auth middleware after validating session.
+    Returns a token for reset_current_user_id().
     """
-    _current_user_id.set(user_id)
+    return _current_user_id.set(user_id)
 
 
-def clear_current_user_id() -> None:
+def reset_current_user_id(token: Token) -> None:
     """
-    Clear user context.
+    Restore the user context that was in place before set_current_user_id().
 
-    Called by auth middleware after request completes.
-    Must be called in finally block to prevent context leakage.
+    Must be called in the same context the token came from.
     """
-    _current_user_id.set(None)
+    _current_user_id.reset(token)
 
 
 @contextmanager
@@ -58,12 +58,8 @@ def user_context(user_id: UUID):
             # All operations here use some_user_id for RLS
             contacts = contact_service.list()
     """
-    previous = _current_user_id.get()
-    set_current_user_id(user_id)
+    token = set_current_user_id(user_id)
     try:
         yield
     finally:
-        if previous is None:
-            clear_current_user_id()
-        else:
-            set_current_user_id(previous)
+        reset_current_user_id(token)